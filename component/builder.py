@@ -9,11 +9,22 @@ Components Builder
 Build the components at the build of a registry.
 
 """
+import logging
+import weakref
+
 import odoo
 from odoo import models
 
 from .core import DEFAULT_CACHE_SIZE, ComponentRegistry, _component_databases
 
+# The last registry built for the addons of a database, by fingerprint of the
+# addons (see ComponentBuilder._registry_fingerprint), so a database with the
+# same addons as another one reuses its components.  A registry is removed
+# when no database uses it anymore.
+_shared_registries = weakref.WeakValueDictionary()
+
+_logger = logging.getLogger(__name__)
+
 
 class ComponentBuilder(models.AbstractModel):
     """Build the component classes
@@ -26,6 +37,10 @@ class ComponentBuilder(models.AbstractModel):
     a ``_name`` and applying Components with an ``_inherits`` upon them.
 
     The final Component classes are registered in global registry.
+    Every database has its own registry, with its own lookup cache and
+    statistics, but the databases with the same installed addons share the
+    component classes and their caches, and copy the cached lookups of the
+    last registry built for these addons (see ``_components_registry_shared``).
 
     This class is an Odoo model, allowing us to hook the build of the
     components at the end of the Odoo's registry loading, using
@@ -39,6 +54,23 @@ class ComponentBuilder(models.AbstractModel):
     _description = "Component Builder"
 
     _components_registry_cache_size = DEFAULT_CACHE_SIZE
+    # size the lookup cache from the keys used during a warm-up
+    _components_registry_cache_autosize = False
+    # fill the lookup caches at the end of the build of the registry
+    _components_registry_prewarm = False
+    # load the components of an addon only when a lookup needs them,
+    # the lookup caches are not prewarmed then
+    _components_registry_lazy = False
+    # reuse the components already built the same way by the registries of
+    # the process, and the lookup cache of the previous registry of the
+    # database when the registry is rebuilt
+    _components_registry_incremental = True
+    # share the components between the registries of the databases having
+    # the same addons, the components of lazy registries are not shared
+    _components_registry_shared = True
+    # log the calls of the components lasting longer than this number of
+    # seconds (see AbstractComponent._log_slow_calls), None to disable it
+    _components_registry_slow_call_threshold = None
 
     def _register_hook(self):
         # This method is called by Odoo when the registry is built,
@@ -48,15 +80,59 @@ class ComponentBuilder(models.AbstractModel):
         components_registry = self._init_global_registry()
         self.build_registry(components_registry)
         components_registry.ready = True
+        # the components will not change until the next build
+        components_registry.freeze()
+        # the previous registry is used until the new one is ready
+        previous_registry = _component_databases.get(self.env.cr.dbname)
+        _component_databases[self.env.cr.dbname] = components_registry
+        self._release_registry(previous_registry)
+
+    def _release_registry(self, previous_registry):
+        """Release the previous registry of the database
+
+        Its caches are cleared, except the ones of the components shared with
+        the registries of the databases, so the component classes it built
+        can be garbage collected.
+        """
+        if previous_registry is None:
+            return
+        previous_registry.release(keep=list(_component_databases.values()))
+
+    def _registry_fingerprint(self, module_names):
+        """Return a key identifying the components registry of a database
+
+        The components of a registry depend only on the addons loaded,
+        in the order of their dependencies, and the options of the
+        registry, so the databases with the same fingerprint can share
+        the same components.
+        """
+        return (
+            tuple(module_names),
+            self._components_registry_cache_size,
+            self._components_registry_cache_autosize,
+            self._components_registry_prewarm,
+            self._components_registry_lazy,
+            self._components_registry_slow_call_threshold,
+        )
 
     def _init_global_registry(self):
         components_registry = ComponentRegistry(
-            cachesize=self._components_registry_cache_size
+            cachesize=self._components_registry_cache_size,
+            cache_autosize=self._components_registry_cache_autosize,
+        )
+        components_registry.slow_call_threshold = (
+            self._components_registry_slow_call_threshold
         )
-        _component_databases[self.env.cr.dbname] = components_registry
         return components_registry
 
     def build_registry(self, components_registry, states=None, exclude_addons=None):
+        module_names = self._get_components_modules(
+            states=states, exclude_addons=exclude_addons
+        )
+        self._load_registry_components(components_registry, module_names)
+
+    def _get_components_modules(self, states=None, exclude_addons=None):
+        """Return the names of the addons to load, by order of dependencies"""
         if not states:
             states = ("installed", "to upgrade")
         # lookup all the installed (or about to be) addons and generate
@@ -74,9 +150,52 @@ class ComponentBuilder(models.AbstractModel):
 
         module_list = [name for (name,) in self.env.cr.fetchall() if name not in graph]
         graph.add_modules(self.env.cr, module_list)
-
-        for module in graph:
-            self.load_components(module.name, components_registry=components_registry)
+        return [module.name for module in graph]
+
+    def _load_registry_components(self, components_registry, module_names):
+        if self._components_registry_lazy:
+            components_registry.defer_components(module_names)
+            return
+        source_registry = self._source_registry(components_registry, module_names)
+        if source_registry is not None or self._components_registry_incremental:
+            rebuilt = components_registry.load_components_from(
+                source_registry, module_names
+            )
+            _logger.debug(
+                "%d components built, %d reused from other registries",
+                len(rebuilt),
+                len(set(components_registry) - rebuilt),
+            )
+        else:
+            for module_name in module_names:
+                self.load_components(
+                    module_name, components_registry=components_registry
+                )
+        if self._components_registry_shared:
+            fingerprint = self._registry_fingerprint(module_names)
+            _shared_registries[fingerprint] = components_registry
+
+        if self._components_registry_prewarm:
+            # the first jobs of the workers will not have to fill the caches
+            components_registry.prewarm()
+
+    def _source_registry(self, components_registry, module_names):
+        """Return the registry to reuse the components from
+
+        The registry of another database with the same addons, or the
+        current registry of the database, which is rebuilt.
+        """
+        source_registries = []
+        if self._components_registry_shared:
+            fingerprint = self._registry_fingerprint(module_names)
+            source_registries.append(_shared_registries.get(fingerprint))
+        if self._components_registry_incremental:
+            source_registries.append(_component_databases.get(self.env.cr.dbname))
+        for source_registry in source_registries:
+            # not the registries being built
+            if source_registry is not None and source_registry.ready:
+                return source_registry
+        return None
 
     def load_components(self, module, components_registry=None):
         """Build every component known by MetaComponent for an odoo module
@@ -16,29 +16,324 @@ The most common classes used publicly are:
 
 """
 
+import functools
+import heapq
+import itertools
 import logging
-import operator
-from collections import OrderedDict, defaultdict
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from types import FunctionType, MappingProxyType
 
 from odoo import models
 from odoo.tools import LastOrderedSet, OrderedSet
 
-from .exception import NoComponentError, RegistryNotReadyError, SeveralComponentError
+from .exception import (
+    NoComponentError,
+    RegistryFrozenError,
+    RegistryNotReadyError,
+    SeveralComponentError,
+)
 
 _logger = logging.getLogger(__name__)
 
-try:
-    from cachetools import LRUCache, cachedmethod
-except ImportError:
-    _logger.debug("Cannot import 'cachetools'.")
-
-
 # The Cache size represents the number of items, so the number
 # of components (include abstract components) we will keep in the LRU
-# cache. We would need stats to know what is the average but this is a bit
-# early.
+# cache. The statistics of the caches (see
+# :func:`~odoo.addons.component.utils.get_component_registry_cache_stats`)
+# tell if it is large enough, otherwise, it can be sized automatically
+# (see :class:`StatsLRUCache`).
 DEFAULT_CACHE_SIZE = 512
 
+# Number of reads after which an automatically sized cache gets its size
+DEFAULT_CACHE_WARMUP = 10000
+# Size of an automatically sized cache, relative to the number of distinct
+# keys read during the warm-up, so keys that were not seen yet still fit
+CACHE_AUTOSIZE_FACTOR = 1.5
+CACHE_AUTOSIZE_MIN_SIZE = 64
+# Part of the entries evicted at once when a cache is full, so the least
+# recently used entries are not searched on every write
+CACHE_EVICTION_RATIO = 0.1
+
+# Component classes built by AbstractComponent._build_component which are
+# still alive, for the memory reports of the registries
+_built_components = weakref.WeakSet()
+
+# Component classes by signature (see ComponentRegistry.load_components_from),
+# so the registries of the process share the components built the same way
+_composed_components = weakref.WeakValueDictionary()
+
+# names of the public methods of the component classes, see
+# _component_public_methods()
+_public_methods_cache = weakref.WeakKeyDictionary()
+
+
+class StatsLRUCache:
+    """Least Recently Used cache keeping statistics about its usage
+
+    It is used by the lookups of the components, and counts the hits,
+    misses and evictions, which can be read with :meth:`stats`.
+
+    When ``autosize`` is set, the cache is not bounded during a warm-up
+    of ``warmup`` reads. At the end of the warm-up, it takes a size
+    proportional to the number of distinct keys read during the warm-up.
+
+    The cache is shared by the threads of the server and the reads do not
+    take any lock: a read or a write of a key in a dict is atomic, the
+    writes are done under a lock and the iterations on a copy of the keys.
+    The reads only record when a key was last used, to find the least
+    recently used entries when the cache is full: a part of the entries
+    (``CACHE_EVICTION_RATIO``) is then evicted at once. The statistics are
+    not exact when threads read the cache at the same time.
+
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, autosize=False, warmup=None):
+        self._data = {}
+        # last read or write of the keys, by key
+        self._used = {}
+        self._clock = itertools.count()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if autosize:
+            # not bounded until the end of the warm-up
+            self._maxsize = None
+            self._warmup = warmup or DEFAULT_CACHE_WARMUP
+            self._warmup_keys = set()
+        else:
+            self._maxsize = maxsize
+            self._warmup = 0
+            self._warmup_keys = None
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def currsize(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if self._warmup_keys is not None:
+            self._warmup_read(key)
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self._used[key] = next(self._clock)
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._used[key] = next(self._clock)
+            self._evict()
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+            self._used.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data = {}
+            self._used = {}
+
+    def items(self):
+        """Entries from the least to the most recently used
+
+        They are not counted as reads.
+        """
+        used = self._used
+        return sorted(list(self._data.items()), key=lambda item: used.get(item[0], -1))
+
+    def _evict(self):
+        """Remove the least recently used entries beyond the size
+
+        Called under the lock.
+        """
+        data = self._data
+        used = self._used
+        if self._maxsize is not None and len(data) > self._maxsize:
+            excess = (
+                len(data) - self._maxsize + int(self._maxsize * CACHE_EVICTION_RATIO)
+            )
+            oldest = heapq.nsmallest(excess, data, key=lambda key: used.get(key, -1))
+            for key in oldest:
+                del data[key]
+                used.pop(key, None)
+            self.evictions += len(oldest)
+        if len(used) > 2 * len(data):
+            # keys read by other threads while they were evicted
+            self._used = {key: used.get(key, -1) for key in data}
+
+    def _warmup_read(self, key):
+        warmup_keys = self._warmup_keys
+        if warmup_keys is None:
+            # ended by another thread
+            return
+        warmup_keys.add(key)
+        self._warmup -= 1
+        if self._warmup > 0:
+            return
+        with self._lock:
+            if self._warmup_keys is None:
+                return
+            distinct = len(self._warmup_keys)
+            self._maxsize = max(
+                CACHE_AUTOSIZE_MIN_SIZE, int(distinct * CACHE_AUTOSIZE_FACTOR)
+            )
+            self._warmup_keys = None
+            self._evict()
+        _logger.debug(
+            "Cache sized to %s items after a warm-up with %s distinct keys",
+            self._maxsize,
+            distinct,
+        )
+
+    def stats(self):
+        """Return the statistics of the cache as a dict"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "currsize": self.currsize,
+            "maxsize": self._maxsize,
+            "warmup": self._warmup_keys is not None,
+        }
+
+
+class ShardedLRUCache:
+    """Lookup cache partitioned by collection
+
+    The keys are ``(collection_name, usage, model_name)`` tuples, every
+    collection has its own :class:`StatsLRUCache` (a shard), so the lookups
+    of a collection never evict the entries of another one. The lookups
+    without collection have their own shard too.
+
+    It has the interface of :class:`StatsLRUCache`, the statistics are the
+    sums of the ones of the shards, which are also given by collection.
+
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, autosize=False, warmup=None):
+        self._maxsize = maxsize
+        self._autosize = autosize
+        self._warmup = warmup
+        self._shards = {}
+        self._lock = threading.Lock()
+
+    def shard(self, collection_name):
+        """Return the cache of the lookups of a collection"""
+        shard = self._shards.get(collection_name)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.get(collection_name)
+                if shard is None:
+                    shard = StatsLRUCache(
+                        maxsize=self._maxsize,
+                        autosize=self._autosize,
+                        warmup=self._warmup,
+                    )
+                    self._shards[collection_name] = shard
+        return shard
+
+    def shards(self):
+        """Return the shards by collection name"""
+        return dict(self._shards)
+
+    @property
+    def maxsize(self):
+        """Size of every shard, ``None`` for an automatically sized cache"""
+        return None if self._autosize else self._maxsize
+
+    @property
+    def hits(self):
+        return sum(shard.hits for shard in self.shards().values())
+
+    @property
+    def misses(self):
+        return sum(shard.misses for shard in self.shards().values())
+
+    @property
+    def evictions(self):
+        return sum(shard.evictions for shard in self.shards().values())
+
+    @property
+    def currsize(self):
+        return len(self)
+
+    def __getitem__(self, key):
+        return self.shard(key[0])[key]
+
+    def __setitem__(self, key, value):
+        self.shard(key[0])[key] = value
+
+    def __delitem__(self, key):
+        shard = self._shards.get(key[0])
+        if shard is None:
+            raise KeyError(key)
+        del shard[key]
+
+    def __contains__(self, key):
+        shard = self._shards.get(key[0])
+        return shard is not None and key in shard
+
+    def __len__(self):
+        return sum(len(shard) for shard in self.shards().values())
+
+    def __iter__(self):
+        for shard in self.shards().values():
+            yield from shard
+
+    def clear(self):
+        with self._lock:
+            self._shards = {}
+
+    def items(self):
+        """Entries of every shard, from the least to the most recently used
+
+        They are not counted as reads.
+        """
+        items = []
+        for shard in self.shards().values():
+            items += shard.items()
+        return items
+
+    def stats(self):
+        """Return the statistics of the cache as a dict
+
+        The statistics of every shard are under the ``shards`` key, by
+        collection name.
+        """
+        shards = self.shards()
+        shards_stats = {
+            collection_name: shard.stats() for collection_name, shard in shards.items()
+        }
+        return {
+            "hits": sum(stats["hits"] for stats in shards_stats.values()),
+            "misses": sum(stats["misses"] for stats in shards_stats.values()),
+            "evictions": sum(stats["evictions"] for stats in shards_stats.values()),
+            "currsize": sum(stats["currsize"] for stats in shards_stats.values()),
+            "maxsize": self.maxsize,
+            "warmup": any(stats["warmup"] for stats in shards_stats.values()),
+            "shards": shards_stats,
+        }
+
 
 # this is duplicated from odoo.models.MetaModel._get_addon_name() which we
 # unfortunately can't use because it's an instance method and should have been
@@ -60,6 +355,258 @@ class ComponentDatabases(dict):
     """Holds a registry of components for each database"""
 
 
+class ComponentIndex:
+    """Inverted index of the non-abstract components of a registry
+
+    The components are indexed by ``_collection``, ``_usage`` and model
+    (``apply_on_models``), each key giving the set of positions of the
+    matching components in the registration order. A lookup is then
+    an intersection of a few sets, and the positions are used to
+    return the components in their registration order.
+
+    The index is a snapshot of the components' attributes at the time it
+    is built: it has to be built again when components are added or
+    modified in the registry.
+
+    It also keeps the components which override
+    :meth:`AbstractComponent._component_match`: the other ones always
+    match, so there is no need to call the method on them.
+
+    When ``sharded`` is set, the index is also partitioned by collection:
+    every collection has its own index (a shard) of its components and of
+    the components without collection, used for the lookups of the
+    collection, so they do not have to go through the components of the
+    other collections.
+
+    """
+
+    def __init__(self, components, sharded=True):
+        self._components = tuple(
+            component for component in components if not component._abstract
+        )
+        self._all = frozenset(range(len(self._components)))
+        self._by_collection = defaultdict(set)
+        self._by_usage = defaultdict(set)
+        self._by_model = defaultdict(set)
+        # components without ``_apply_on`` match any model
+        self._any_model = set()
+        for position, component in enumerate(self._components):
+            self._by_collection[component._collection].add(position)
+            self._by_usage[component._usage].add(position)
+            apply_on_models = component.apply_on_models
+            if apply_on_models is None:
+                self._any_model.add(position)
+            else:
+                for model_name in apply_on_models:
+                    self._by_model[model_name].add(position)
+        self.match_overrides = frozenset(
+            component
+            for component in self._components
+            # a staticmethod or a function has no __func__
+            if getattr(
+                component._component_match, "__func__", component._component_match
+            )
+            is not AbstractComponent._component_match.__func__
+        )
+        self._shards = None
+        if sharded:
+            shared = [
+                component
+                for component in self._components
+                if component._collection is None
+            ]
+            self._shared_shard = ComponentIndex(shared, sharded=False)
+            self._shards = {
+                collection_name: ComponentIndex(
+                    (
+                        component
+                        for component in self._components
+                        if component._collection in (collection_name, None)
+                    ),
+                    sharded=False,
+                )
+                for collection_name in self._by_collection
+                if collection_name is not None
+            }
+
+    def shard(self, collection_name):
+        """Return the index of the components usable in a collection"""
+        if self._shards is None:
+            return None
+        return self._shards.get(collection_name, self._shared_shard)
+
+    def lookup(self, collection_name=None, usage=None, model_name=None):
+        """Return the components matching the criteria
+
+        See :meth:`ComponentRegistry.lookup` for the rules.
+        """
+        if collection_name is not None and self._shards is not None:
+            return self.shard(collection_name).lookup(None, usage, model_name)
+        positions = self._all
+        if usage is not None:
+            positions = positions.intersection(self._by_usage.get(usage, ()))
+        if positions and collection_name is not None:
+            # components without collection are shared by all the collections
+            positions = positions.intersection(
+                self._by_collection.get(collection_name, set()).union(
+                    self._by_collection.get(None, ())
+                )
+            )
+        if positions and model_name is not None:
+            positions = positions.intersection(
+                self._any_model.union(self._by_model.get(model_name, ()))
+            )
+        # keep the order so addons loaded first have components used first
+        return tuple(self._components[position] for position in sorted(positions))
+
+    def lookup_keys(self):
+        """Return the lookups which are likely to be done on the components
+
+        They are the ``(collection_name, usage, model_name)`` declared by the
+        components. A component without ``_collection`` is declared for
+        every collection, and a component without ``_apply_on`` for every
+        model declared by the components of its collection.
+        """
+        collections = sorted(name for name in self._by_collection if name is not None)
+        collection_models = defaultdict(set)
+        for component in self._components:
+            if component.apply_on_models is not None:
+                collection_models[component._collection].update(
+                    component.apply_on_models
+                )
+        keys = {}
+        for component in self._components:
+            if component._usage is None:
+                continue
+            if component._collection is None:
+                component_collections = collections
+            else:
+                component_collections = [component._collection]
+            for collection_name in component_collections:
+                if component.apply_on_models is None:
+                    model_names = sorted(
+                        collection_models[collection_name] | collection_models[None]
+                    )
+                else:
+                    model_names = component.apply_on_models
+                for model_name in model_names:
+                    keys[(collection_name, component._usage, model_name)] = None
+        return list(keys)
+
+
+def _component_parents(component_class):
+    """Return the name of the component built by a class and its parents
+
+    As computed by :meth:`AbstractComponent._build_component`, the name is
+    empty for an invalid class.
+    """
+    parents = component_class._inherit
+    if isinstance(parents, str):
+        parents = [parents]
+    elif parents is None:
+        parents = []
+    name = component_class._name or (len(parents) == 1 and parents[0])
+    if name and name != "base":
+        parents = list(parents) + ["base"]
+    return name, [parent for parent in parents if parent != name]
+
+
+class DeferredModules:
+    """Addons of a registry whose components are loaded on demand
+
+    The components of the addons are loaded in the order of the addons, as
+    they would be by :meth:`ComponentRegistry.load_components`, but only
+    when a component or a lookup needs them. The addons needed by a
+    component are found from its Python classes, without building it: the
+    addons declaring or extending it, and the ones of the components it
+    inherits from, as they all change the final component class.
+
+    A lookup needs the components which may have the looked up usage: the
+    ``_usage`` declared on their classes or on the components they inherit
+    from.
+
+    """
+
+    def __init__(self, module_names, components):
+        self.modules = deque(module_names)
+        self._module_positions = {
+            module: position for position, module in enumerate(module_names)
+        }
+        # position of the last addon declaring or extending a component
+        self._name_positions = {}
+        self._parents = defaultdict(set)
+        self._usages = defaultdict(set)
+        for name, component in components.items():
+            # components already loaded in the registry
+            self._parents[name].update(
+                base._name
+                for base in component.__bases__
+                if base._name != name and components.get(base._name) is base
+            )
+            self._usages[name].add(component._usage)
+        for position, module in enumerate(module_names):
+            for component_class in MetaComponent._modules_components[module]:
+                name, parents = _component_parents(component_class)
+                if not name:
+                    # will fail when it is built
+                    continue
+                self._name_positions[name] = position
+                self._parents[name].update(parents)
+                for klass in component_class.__mro__:
+                    if "_usage" in klass.__dict__:
+                        self._usages[name].add(klass.__dict__["_usage"])
+        self._required_positions = {}
+        self._usage_positions = {}
+
+    @property
+    def next_position(self):
+        """Position of the next addon to load"""
+        if not self.modules:
+            return len(self._module_positions)
+        return self._module_positions[self.modules[0]]
+
+    def module_position(self, module):
+        return self._module_positions.get(module, -1)
+
+    def _ancestors(self, name):
+        ancestors = {name}
+        stack = [name]
+        while stack:
+            for parent in self._parents.get(stack.pop(), ()):
+                if parent not in ancestors:
+                    ancestors.add(parent)
+                    stack.append(parent)
+        return ancestors
+
+    def name_position(self, name):
+        """Position of the last addon to load to get the component ``name``"""
+        try:
+            return self._required_positions[name]
+        except KeyError:
+            pass
+        position = max(
+            self._name_positions.get(ancestor, -1) for ancestor in self._ancestors(name)
+        )
+        self._required_positions[name] = position
+        return position
+
+    def usage_position(self, usage):
+        """Position of the last addon to load to lookup a usage"""
+        if usage is None:
+            return len(self._module_positions) - 1
+        try:
+            return self._usage_positions[usage]
+        except KeyError:
+            pass
+        position = -1
+        for name in self._name_positions:
+            ancestors = self._ancestors(name)
+            if any(usage in self._usages.get(ancestor, ()) for ancestor in ancestors):
+                position = max(position, self.name_position(name))
+        self._usage_positions[usage] = position
+        return position
+
+
 class ComponentRegistry:
     """Store all the components and allow to find them using criteria
 
@@ -69,39 +616,550 @@ class ComponentRegistry:
     the components, addons loaded first have their components found first.
 
     The :attr:`ready` attribute must be set to ``True`` when all the components
-    are loaded.
+    are loaded. At this point, the components are indexed
+    (:class:`ComponentIndex`) for the lookups. The index is built again
+    if components are added after that, which normally happens only in
+    tests. The index and the cache of the lookups are partitioned by
+    collection (see :class:`ShardedLRUCache`), so the lookups of a
+    collection only use the components and the cache of this collection.
+
+    Once ready, the registry can be frozen with :meth:`freeze`: the
+    components cannot be modified anymore and the lookups return tuples,
+    which can be shared by the callers without copies.
+
+    The loading of the components of addons can be deferred with
+    :meth:`defer_components`: they are loaded when a component or a lookup
+    needs them (see :class:`DeferredModules`).
 
     """
 
-    def __init__(self, cachesize=DEFAULT_CACHE_SIZE):
-        self._cache = LRUCache(maxsize=cachesize)
+    def __init__(self, cachesize=DEFAULT_CACHE_SIZE, cache_autosize=False):
+        self._cache = ShardedLRUCache(maxsize=cachesize, autosize=cache_autosize)
         self._components = OrderedDict()
         self._loaded_modules = set()
+        # classes of the components loaded for every addon
+        self._modules_classes = OrderedDict()
+        self._index = None
+        # component classes shared with the registry this one is cloned from
+        self._shared_components = set()
+        # children added to these classes, by component name, see
+        # _add_inherit_child()
+        self._shared_children = defaultdict(OrderedSet)
+        # time spent to build the components, by component
+        self._build_profile = {}
+        # components (or errors) by name, collection and model, see
+        # WorkContext.component_by_name
+        self._by_name_cache = {}
+        self._frozen = False
+        self._deferred = None
+        self._load_lock = threading.RLock()
+        # thread loading deferred components, allowed to modify the
+        # registry even if it is frozen
+        self._loading_thread = None
+        # duration in seconds above which the calls of the components are
+        # logged (see AbstractComponent._log_slow_calls)
+        self.slow_call_threshold = None
         self.ready = False
 
+    @property
+    def ready(self):
+        return self._ready
+
+    @ready.setter
+    def ready(self, value):
+        self._ready = value
+        if value:
+            self._get_index()
+
+    def _get_index(self):
+        if self._index is None:
+            if self._deferred is not None:
+                # components may be added by another thread
+                with self._load_lock:
+                    self._index = ComponentIndex(self._components.values())
+            else:
+                self._index = ComponentIndex(self._components.values())
+        return self._index
+
+    @property
+    def component_match_overrides(self):
+        """Components with their own :meth:`~AbstractComponent._component_match`
+
+        The lookups are cached, but this method has to be evaluated on
+        these components each time we get components.
+        """
+        return self._get_index().match_overrides
+
+    @property
+    def index(self):
+        """Index of the components (:class:`ComponentIndex`)
+
+        A new index is built when the components are modified, so it can be
+        used as a key to cache data computed from the components.
+        """
+        return self._get_index()
+
     def __getitem__(self, key):
+        if self._deferred is not None:
+            self._load_deferred(self._deferred.name_position(key))
         return self._components[key]
 
     def __setitem__(self, key, value):
+        if self.frozen:
+            raise RegistryFrozenError(
+                "Cannot register component %r: the registry is frozen." % key
+            )
         self._components[key] = value
+        # a new or modified component may change the attributes of the
+        # other components (through ``__bases__``), index them again
+        self._index = None
+        self._by_name_cache = {}
 
     def __contains__(self, key):
+        if self._deferred is not None:
+            self._load_deferred(self._deferred.name_position(key))
         return key in self._components
 
     def get(self, key, default=None):
+        if self._deferred is not None:
+            self._load_deferred(self._deferred.name_position(key))
         return self._components.get(key, default)
 
     def __iter__(self):
+        self._load_all()
         return iter(self._components)
 
+    @property
+    def frozen(self):
+        # the deferred components are still loaded in a frozen registry
+        return self._frozen and self._loading_thread != threading.get_ident()
+
+    def clone(self):
+        """Return a copy of the registry, to add components to it
+
+        The component classes are shared with the copy until a component is
+        extended in the copy: the component and the components inheriting
+        from it are copied first. It is used by the tests to add components
+        to a registry built once.
+        """
+        self._load_all()
+        clone = type(self)(
+            cachesize=self._cache._maxsize, cache_autosize=self._cache._autosize
+        )
+        clone._components = OrderedDict(self._components)
+        clone._loaded_modules = set(self._loaded_modules)
+        clone._modules_classes = OrderedDict(self._modules_classes)
+        clone._index = self._index
+        clone.slow_call_threshold = self.slow_call_threshold
+        clone._shared_components = set(self._components.values())
+        # the caches kept on the component classes depend on the other
+        # components of the registry, the copy needs its own ones
+        for name, component in list(clone._components.items()):
+            if isinstance(component.__dict__.get("_cache"), StatsLRUCache):
+                clone._extensible_component(name)
+        return clone
+
+    def _extensible_component(self, name):
+        """Return the class of a component to extend it
+
+        A component shared with the registry this one is cloned from is
+        copied, with the components inheriting from it, and the components
+        of the registry inheriting from the copied classes are based on
+        the copies.
+        """
+        component = self._components[name]
+        if component not in self._shared_components:
+            return component
+        copies = {}
+        inheriting = [
+            other
+            for other in self._components.values()
+            if other in self._shared_components and issubclass(other, component)
+        ]
+        # a component may inherit from a component registered after it, the
+        # bases of a class have a shorter mro, so they are copied first
+        for other in sorted(inheriting, key=lambda other: len(other.__mro__)):
+            attrs = {
+                key: value
+                for key, value in other.__dict__.items()
+                if key not in ("__dict__", "__weakref__")
+            }
+            attrs["_register"] = False
+            attrs["_inherit_children"] = OrderedSet(
+                list(other._inherit_children)
+                + list(self._shared_children.pop(other._name, ()))
+            )
+            copy = type(
+                other.__name__,
+                tuple(copies.get(base, base) for base in other.__bases__),
+                attrs,
+            )
+            copy._complete_component_build()
+            _built_components.add(copy)
+            copies[other] = copy
+            self._shared_components.discard(other)
+            self[other._name] = copy
+        # the components copied or built before in this registry
+        copied = set(copies.values())
+        for other in list(self._components.values()):
+            if other in self._shared_components or other in copied:
+                continue
+            if any(base in copies for base in other.__bases__):
+                other.__bases__ = tuple(
+                    copies.get(base, base) for base in other.__bases__
+                )
+        return copies[component]
+
+    def _add_inherit_child(self, parent_class, name):
+        """Add a component to the ``_inherit_children`` of its parent
+
+        The children of a class shared with the registry this one is cloned
+        from are kept by the registry, until the class is copied.
+        """
+        if parent_class in self._shared_components:
+            self._shared_children[parent_class._name].add(name)
+        else:
+            parent_class._inherit_children.add(name)
+
+    def defer_components(self, modules):
+        """Load the components of addons only when they are needed
+
+        The addons must be given in the order of their dependencies, and
+        their components are loaded in this order, the result is the same
+        as calling :meth:`load_components` for every addon.
+        """
+        modules = [module for module in modules if module not in self._loaded_modules]
+        with self._load_lock:
+            self._load_all()
+            self._deferred = DeferredModules(modules, self._components)
+
+    def _load_all(self):
+        if self._deferred is not None:
+            self._load_deferred(self._deferred.usage_position(None))
+
+    def _load_deferred(self, position):
+        """Load the deferred addons up to ``position``"""
+        deferred = self._deferred
+        if deferred is None or position < deferred.next_position:
+            return
+        if self._loading_thread == threading.get_ident():
+            # loading, components are accessed by the build of the components
+            return
+        with self._load_lock:
+            if self._deferred is not deferred:
+                return
+            self._loading_thread = threading.get_ident()
+            try:
+                while deferred.modules and deferred.next_position <= position:
+                    self._load_module(deferred.modules[0])
+                    deferred.modules.popleft()
+            finally:
+                self._loading_thread = None
+            if not deferred.modules:
+                self._deferred = None
+                if self._frozen:
+                    self._seal()
+
+    def freeze(self):
+        """Prevent any further modification of the registry
+
+        Called by the component builder once all the components are loaded
+        and the registry is ready. Adding or modifying a component then
+        raises a :exc:`~odoo.addons.component.exception.RegistryFrozenError`
+        and :meth:`lookup` returns immutable results. The components loaded
+        are then notified with
+        :meth:`AbstractComponent._component_registry_ready`.
+        """
+        if not self.ready:
+            raise RegistryNotReadyError("Cannot freeze a registry not ready.")
+        if self._frozen:
+            return
+        self._get_index()
+        self._frozen = True
+        # the results cached before are mutable lists
+        for shard in self._cache.shards().values():
+            for key, components in shard.items():
+                shard[key] = self._lookup_result(components)
+        if self._deferred is None:
+            self._seal()
+        # the hooks may load the components of the deferred addons
+        for component in list(self._components.values()):
+            component._component_registry_ready(self)
+
+    def _seal(self):
+        self._components = MappingProxyType(self._components)
+        self._loaded_modules = frozenset(self._loaded_modules)
+        self._modules_classes = MappingProxyType(self._modules_classes)
+
+    def cache_stats(self):
+        """Return the statistics of the caches used for the lookups
+
+        The statistics of the lookup cache of the registry are under the
+        ``lookup`` key, the ones of the caches kept on component classes
+        (such as the one of the events collecter) are under the name of
+        the component.
+        """
+        stats = {"lookup": self._cache.stats()}
+        # only the components loaded so far
+        for name, component in list(self._components.items()):
+            cache = component.__dict__.get("_cache")
+            if isinstance(cache, StatsLRUCache):
+                stats[name] = cache.stats()
+        return stats
+
+    def _add_build_time(self, name, build_time, hooks_time):
+        profile = self._build_profile.setdefault(
+            name, {"builds": 0, "time": 0.0, "hooks_time": 0.0}
+        )
+        profile["builds"] += 1
+        profile["time"] += build_time
+        profile["hooks_time"] += hooks_time
+
+    def build_profile(self):
+        """Return the time spent to build the components
+
+        For every component built in this registry, the slowest first: the
+        number of classes it has been built from (``builds``), the time
+        spent in :meth:`AbstractComponent._build_component` (``time``), and
+        in the :meth:`AbstractComponent._complete_component_build` hooks
+        (``hooks_time``), in seconds. The components reused from another
+        registry are not built.
+        """
+        return OrderedDict(
+            sorted(
+                self._build_profile.items(),
+                key=lambda item: item[1]["time"],
+                reverse=True,
+            )
+        )
+
+    def memory_report(self):
+        """Return the number of component classes and cache entries alive
+
+        ``components`` is the number of components of the registry and
+        ``live_component_classes`` the number of component classes built by
+        any registry of the process and not garbage collected yet: if it
+        grows after every rebuild of the registries, the classes of the
+        previous registries are still referenced somewhere.
+        """
+        components = list(self._components.values())
+        component_cache_entries = {}
+        for component in components:
+            cache = component.__dict__.get("_cache")
+            if isinstance(cache, StatsLRUCache):
+                component_cache_entries[component._name] = len(cache)
+        return {
+            "components": len(components),
+            "live_component_classes": len(_built_components),
+            "lookup_cache_entries": len(self._cache),
+            "component_cache_entries": component_cache_entries,
+        }
+
+    def release(self, keep=()):
+        """Release the caches of a registry which is not used anymore
+
+        The lookup cache and the caches of the components are cleared, so
+        they do not keep the component classes alive, except the caches of
+        the components shared with the registries ``keep``.
+        """
+        self._cache.clear()
+        self._by_name_cache = {}
+        kept = {
+            component
+            for registry in keep
+            for component in registry._components.values()
+        }
+        for component in list(self._components.values()):
+            cache = component.__dict__.get("_cache")
+            if isinstance(cache, StatsLRUCache) and component not in kept:
+                cache.clear()
+
     def load_components(self, module):
         if module in self._loaded_modules:
             return
-        for component_class in MetaComponent._modules_components[module]:
+        if self._deferred is not None and self._deferred.module_position(module) >= 0:
+            # load it now, after the addons it depends on
+            self._load_deferred(self._deferred.module_position(module))
+            return
+        if self.frozen:
+            raise RegistryFrozenError(
+                "Cannot load the components of %r: the registry is frozen." % module
+            )
+        self._load_module(module)
+
+    def _load_module(self, module):
+        component_classes = tuple(MetaComponent._modules_components[module])
+        for component_class in component_classes:
             component_class._build_component(self)
         self._loaded_modules.add(module)
+        self._modules_classes[module] = component_classes
+
+    def load_components_from(self, previous, modules):
+        """Load the components of addons, reusing the components already built
+
+        The signature of a component is the list of the classes it is built
+        from and of the classes of the components it inherits from, in the
+        order of the addons. A component is reused from ``previous``, or
+        from any registry of the process, when it has the same signature.
+        As the class of a component is modified when it is extended, the
+        components inheriting from a component built again are built again
+        as well.
+
+        The components keeping their own cache are only reused from
+        ``previous`` and when no component changed, as their cache may
+        depend on the other components.
+
+        The entries of the lookup cache of ``previous`` are kept, unless a
+        component which is not in ``previous`` is in their result or may
+        be. When all the components are reused, the index of ``previous``
+        is shared.
+
+        Return the names of the components built again.
+        """
+        if previous is not None and (
+            not previous.ready or previous._deferred is not None
+        ):
+            # the components of previous may still be modified
+            previous = None
+        modules_classes = [
+            (module, tuple(MetaComponent._modules_components[module]))
+            for module in modules
+            if module not in self._loaded_modules
+        ]
+        signatures = self._components_signatures(
+            classes for __, classes in modules_classes
+        )
+        reused = self._reusable_components(previous, signatures)
+        rebuilt = self._with_children(set(signatures) - set(reused), modules_classes)
+        for module, component_classes in modules_classes:
+            for component_class in component_classes:
+                name, __ = _component_parents(component_class)
+                if name in rebuilt or name not in reused:
+                    component_class._build_component(self)
+                elif name not in self._components:
+                    self[name] = reused[name]
+            self._loaded_modules.add(module)
+            self._modules_classes[module] = component_classes
+        for name, signature in signatures.items():
+            if name in self._components:
+                _composed_components[signature] = self._components[name]
+        if previous is not None:
+            self._copy_cache(previous)
+            if list(self._components.values()) == list(previous._components.values()):
+                # same components, the index can be shared
+                self._index = previous._index
+        return rebuilt & set(self._components)
+
+    def _reusable_components(self, previous, signatures):
+        """Return the components already built with the same signatures"""
+        previous_signatures = {}
+        if previous is not None:
+            previous_signatures = self._components_signatures(
+                previous._modules_classes.values()
+            )
+        changed = previous is None or any(
+            previous_signatures.get(name) != signatures.get(name)
+            for name in previous_signatures.keys() | signatures.keys()
+        )
+        reused = {}
+        for name, signature in signatures.items():
+            if previous is not None and previous_signatures.get(name) == signature:
+                component = previous._components.get(name)
+            else:
+                component = _composed_components.get(signature)
+            if component is None or component._name != name:
+                continue
+            if changed and isinstance(component.__dict__.get("_cache"), StatsLRUCache):
+                continue
+            reused[name] = component
+        # a component must inherit from the components reused for its parents
+        return {
+            name: component
+            for name, component in reused.items()
+            if all(
+                reused.get(base._name) is base
+                for base in component.__bases__
+                if base in _built_components and base._name != name
+            )
+        }
+
+    def _with_children(self, names, modules_classes):
+        """Add the components inheriting from ``names``"""
+        children = defaultdict(set)
+        for __, component_classes in modules_classes:
+            for component_class in component_classes:
+                name, parents = _component_parents(component_class)
+                for parent in parents:
+                    children[parent].add(name)
+        names = set(names)
+        stack = list(names)
+        while stack:
+            for child in children[stack.pop()]:
+                if child not in names:
+                    names.add(child)
+                    stack.append(child)
+        return names
+
+    def _copy_cache(self, previous):
+        """Copy the lookups of ``previous`` not affected by the changes
+
+        The components which are not in ``previous``, built again or reused
+        from another registry, may be in the result of any lookup.
+        """
+        previous_components = set(previous._components.values())
+        changed_index = ComponentIndex(
+            (
+                component
+                for component in self._components.values()
+                if component not in previous_components
+            ),
+            sharded=False,
+        )
+        positions = {
+            component: position
+            for position, component in enumerate(self._components.values())
+        }
+        for key, components in previous._cache.items():
+            if any(component not in positions for component in components):
+                continue
+            if changed_index.lookup(*key):
+                continue
+            if list(components) != sorted(components, key=positions.__getitem__):
+                continue
+            self._cache[key] = self._lookup_result(components)
+
+    @staticmethod
+    def _components_signatures(modules_classes):
+        """Return the signature of the components built from classes
+
+        See :meth:`load_components_from`.
+        """
+        sources = defaultdict(list)
+        parents = defaultdict(set)
+        position = 0
+        for component_classes in modules_classes:
+            for component_class in component_classes:
+                name, parent_names = _component_parents(component_class)
+                if not name:
+                    continue
+                sources[name].append((position, component_class))
+                parents[name].update(parent_names)
+                position += 1
+        signatures = {}
+        for name in sources:
+            ancestors = {name}
+            stack = [name]
+            while stack:
+                for parent in parents.get(stack.pop(), ()):
+                    if parent not in ancestors:
+                        ancestors.add(parent)
+                        stack.append(parent)
+            classes = sorted(
+                source for ancestor in ancestors for source in sources.get(ancestor, ())
+            )
+            signatures[name] = tuple(component_class for __, component_class in classes)
+        return signatures
 
-    @cachedmethod(operator.attrgetter("_cache"))
     def lookup(self, collection_name=None, usage=None, model_name=None):
         """Find and return a list of components for a usage
 
@@ -120,6 +1178,10 @@ class ComponentRegistry:
 
         The abstract components are never returned.
 
+        The result is a list, or a tuple when the registry is frozen (see
+        :meth:`freeze`). As the results are cached, the callers must never
+        modify them.
+
         This is a rather low-level function, usually you will use the
         high-level :meth:`AbstractComponent.component`,
         :meth:`AbstractComponent.many_components` or even
@@ -131,42 +1193,138 @@ class ComponentRegistry:
         :param model_name: filter on components that apply on this model
 
         """
+        key = (collection_name, usage, model_name)
+        # only the shard of the collection is used
+        cache = self._cache.shard(collection_name)
+        try:
+            components = cache[key]
+        except KeyError:
+            if self._deferred is not None:
+                self._load_deferred(self._deferred.usage_position(usage))
+            components = self._lookup_result(self._get_index().lookup(*key))
+            cache[key] = components
+        return components
+
+    def _lookup_result(self, components):
+        """Return the result of a lookup as it is kept in the cache
+
+        A tuple when the registry is frozen, else a list.
+        """
+        if self._frozen:
+            return tuple(components)
+        return list(components)
+
+    def prewarm(self):
+        """Fill the lookup caches before the components are used
+
+        The lookups for the collections, usages and models declared by the
+        components (:meth:`ComponentIndex.lookup_keys`) are computed, within
+        the limit of the size of the shard of every collection. Then, the
+        components can fill their own caches in
+        :meth:`AbstractComponent._prewarm_component_cache`.
+        """
+        self._load_all()
+        index = self._get_index()
+        cache = self._cache
+        for key in index.lookup_keys():
+            shard = cache.shard(key[0])
+            if shard.maxsize is not None and len(shard) >= shard.maxsize:
+                continue
+            if key not in shard:
+                shard[key] = self._lookup_result(index.lookup(*key))
+        for component in self._components.values():
+            component._prewarm_component_cache(self)
 
-        # keep the order so addons loaded first have components used first
-        candidates = (
-            component
-            for component in self._components.values()
-            if not component._abstract
-        )
 
-        if collection_name is not None:
-            candidates = (
-                component
-                for component in candidates
-                if (
-                    component._collection == collection_name
-                    or component._collection is None
-                )
-            )
+# We will store a ComponentRegistry per database here,
+# it will be cleared and updated when the odoo's registry is rebuilt
+_component_databases = ComponentDatabases()
 
-        if usage is not None:
-            candidates = (
-                component for component in candidates if component._usage == usage
-            )
 
-        if model_name is not None:
-            candidates = (
-                c
-                for c in candidates
-                if c.apply_on_models is None or model_name in c.apply_on_models
-            )
+def _component_public_methods(cls):
+    """Return the names of the public methods of a component class"""
+    try:
+        return _public_methods_cache[cls]
+    except KeyError:
+        pass
+    names = set()
+    for klass in cls.__mro__:
+        names.update(name for name in vars(klass) if not name.startswith("_"))
+    methods = frozenset(
+        name for name in names if isinstance(getattr(cls, name, None), FunctionType)
+    )
+    _public_methods_cache[cls] = methods
+    return methods
+
+
+class ComponentProfiler:
+    """Measure the calls of the public methods of components
+
+    A profiler is given to a :class:`WorkContext` with the
+    ``components_profiler`` argument, or created by
+    :meth:`~odoo.addons.component.models.collection.Collection.work_on`
+    when the ``components_profile`` key is set in the context. It is
+    propagated to the work contexts created with
+    :meth:`WorkContext.work_on`.
+
+    The public methods of the components created by the work contexts are
+    then timed. The time of a call includes the time of the calls it does
+    to other methods. :meth:`report` gives the number of calls and the
+    time spent by component and method.
+
+    Usage::
+
+        profiler = ComponentProfiler()
+        with backend.work_on('res.partner', components_profiler=profiler) as work:
+            work.component(usage='record.importer').run(external_id)
+        _logger.info('Profile of the import: %s', profiler.report())
 
-        return list(candidates)
+    """
 
+    def __init__(self):
+        # [calls, time] by (component name, method name)
+        self._stats = defaultdict(lambda: [0, 0.0])
 
-# We will store a ComponentRegistry per database here,
-# it will be cleared and updated when the odoo's registry is rebuilt
-_component_databases = ComponentDatabases()
+    def profile(self, component):
+        """Time the calls of the public methods of a component instance"""
+        for name in _component_public_methods(type(component)):
+            method = getattr(component, name)
+            setattr(component, name, self._profiled(component._name, name, method))
+        return component
+
+    def _profiled(self, component_name, method_name, method):
+        stats = self._stats[(component_name, method_name)]
+
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+
+        return profiled
+
+    def report(self):
+        """Return the calls of the methods, the slowest first
+
+        A list of dicts with the ``component``, the ``method``, the number
+        of ``calls`` and the ``time`` spent in seconds, which can be dumped
+        in JSON.
+        """
+        report = [
+            {
+                "component": component_name,
+                "method": method_name,
+                "calls": calls,
+                "time": elapsed,
+            }
+            for (component_name, method_name), (calls, elapsed) in self._stats.items()
+            if calls
+        ]
+        report.sort(key=lambda item: item["time"], reverse=True)
+        return report
 
 
 class WorkContext:
@@ -197,6 +1355,11 @@ class WorkContext:
         Odoo Model for ``model_name`` with the same Odoo
         :class:`~odoo.api.Environment` than the ``collection`` attribute.
 
+    .. attribute:: components_profiler
+
+        Optional :class:`ComponentProfiler` timing the calls of the
+        methods of the components.
+
     This is also the entrypoint to work with the components.
 
     ::
@@ -236,11 +1399,35 @@ class WorkContext:
             # => spawn a new WorkContext with a copy of the attributes
             assert work2.model_name == 'res.users'
             assert work2.hello == 'world'
+            # => the same WorkContext is used for the same model
+            assert work.work_on('res.users') is work2
+
+    The attributes always present are kept in slots, the other ones
+    given as keyword arguments in the ``__dict__`` of the instance, which
+    is only allocated when there are such attributes.
 
     """
 
+    __slots__ = (
+        "collection",
+        "model_name",
+        "model",
+        "components_registry",
+        "components_profiler",
+        "_propagate_kwargs",
+        "_work_contexts",
+        "_component_instances",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
-        self, model_name=None, collection=None, components_registry=None, **kwargs
+        self,
+        model_name=None,
+        collection=None,
+        components_registry=None,
+        components_profiler=None,
+        **kwargs
     ):
         self.collection = collection
         self.model_name = model_name
@@ -264,9 +1451,16 @@ class WorkContext:
                 )
                 raise RegistryNotReadyError(msg) from exc
         self._propagate_kwargs = ["collection", "model_name", "components_registry"]
+        self.components_profiler = components_profiler
+        if components_profiler is not None:
+            self._propagate_kwargs.append("components_profiler")
         for attr_name, value in kwargs.items():
             setattr(self, attr_name, value)
             self._propagate_kwargs.append(attr_name)
+        # work contexts created by work_on, by model and collection
+        self._work_contexts = {}
+        # instances of the stateless components, by component class
+        self._component_instances = {}
 
     @property
     def env(self):
@@ -280,7 +1474,19 @@ class WorkContext:
         """Create a new work context for another model keeping attributes
 
         Used when one need to lookup components for another model.
+
+        The new work context is kept, so it is used again when we switch
+        to the same model and collection, unless the attributes of the
+        current work context have been modified meanwhile.
         """
+        key = (model_name, collection)
+        work = self._work_contexts.get(key)
+        if work is None or not self._is_work_on(work, model_name, collection):
+            work = self._new_work_context(model_name=model_name, collection=collection)
+            self._work_contexts[key] = work
+        return work
+
+    def _new_work_context(self, model_name=None, collection=None):
         kwargs = {
             attr_name: getattr(self, attr_name) for attr_name in self._propagate_kwargs
         }
@@ -290,6 +1496,45 @@ class WorkContext:
             kwargs["model_name"] = model_name
         return self.__class__(**kwargs)
 
+    def _is_work_on(self, work, model_name, collection):
+        """Check if a work context still propagates the current attributes"""
+        if work.model_name != (model_name or self.model_name):
+            return False
+        if collection is not None and work.collection is not collection:
+            return False
+        for attr_name in self._propagate_kwargs:
+            if attr_name == "model_name":
+                continue
+            if attr_name == "collection" and collection is not None:
+                continue
+            if getattr(work, attr_name) is not getattr(self, attr_name):
+                return False
+        return True
+
+    def _component_instance(self, component_class):
+        """Return an instance of a component for this work context
+
+        An instance of a stateless component is shared by all the callers
+        of the work context.
+        """
+        if not component_class._stateless:
+            return self._new_component(component_class)
+        component = self._component_instances.get(component_class)
+        if component is None:
+            component = self._new_component(component_class)
+            self._component_instances[component_class] = component
+        return component
+
+    def _new_component(self, component_class):
+        component = component_class(self)
+        if self.components_profiler is not None:
+            self.components_profiler.profile(component)
+        if component_class._log_slow_calls:
+            threshold = self.components_registry.slow_call_threshold
+            if threshold is not None:
+                component._watch_slow_calls(threshold)
+        return component
+
     def _component_class_by_name(self, name):
         components_registry = self.components_registry
         component_class = components_registry.get(name)
@@ -317,8 +1562,34 @@ class WorkContext:
         """
         if isinstance(model_name, models.BaseModel):
             model_name = model_name._name
-        component_class = self._component_class_by_name(name)
         work_model = model_name or self.model_name
+        # the checks only depend on the registry, keep their result
+        by_name_cache = self.components_registry._by_name_cache
+        key = (name, self.collection._name, work_model)
+        component_class = by_name_cache.get(key)
+        if component_class is None:
+            try:
+                component_class = self._check_component_by_name(name, work_model)
+            except NoComponentError as err:
+                component_class = err.args[0]
+            by_name_cache[key] = component_class
+        if isinstance(component_class, str):
+            raise NoComponentError(component_class)
+
+        if work_model == self.model_name:
+            work_context = self
+        else:
+            work_context = self.work_on(model_name)
+        return work_context._component_instance(component_class)
+
+    def _check_component_by_name(self, name, work_model):
+        """Return the component class of a name usable for a model
+
+        Raise :exc:`odoo.addons.component.exception.NoComponentError` if
+        the component does not exist or cannot be used with the collection
+        or the model.
+        """
+        component_class = self._component_class_by_name(name)
         if (
             component_class._collection
             and self.collection._name != component_class._collection
@@ -342,19 +1613,22 @@ class WorkContext:
                 "component_by_name('%s', model_name=%s)"
                 % (name, work_model, name, hint_models)
             )
-
-        if work_model == self.model_name:
-            work_context = self
-        else:
-            work_context = self.work_on(model_name)
-        return component_class(work_context)
+        return component_class
 
     def _lookup_components(self, usage=None, model_name=None, **kw):
-        component_classes = self.components_registry.lookup(
+        components_registry = self.components_registry
+        component_classes = components_registry.lookup(
             self.collection._name, usage=usage, model_name=model_name
         )
+        match_overrides = components_registry.component_match_overrides
+        if match_overrides.isdisjoint(component_classes):
+            # none of the candidates can be discarded by _component_match
+            return list(component_classes)
         matching_components = []
         for cls in component_classes:
+            if cls not in match_overrides:
+                matching_components.append(cls)
+                continue
             try:
                 matching = cls._component_match(
                     self, usage=usage, model_name=model_name, **kw
@@ -453,7 +1727,7 @@ class WorkContext:
                     component_classes,
                 )
             )
-        return component_classes[0](work_context)
+        return work_context._component_instance(component_classes[0])
 
     def many_components(self, usage=None, model_name=None, **kw):
         """Find many components by usage and model for the current collection
@@ -470,7 +1744,7 @@ class WorkContext:
         component_classes, work_context = self._matching_components(
             usage=usage, model_name=model_name, **kw
         )
-        return [comp(work_context) for comp in component_classes]
+        return [work_context._component_instance(comp) for comp in component_classes]
 
     def __str__(self):
         return "WorkContext({}, {})".format(self.model_name, repr(self.collection))
@@ -694,6 +1968,21 @@ class AbstractComponent(metaclass=MetaComponent):
     #: Component purpose ('import.mapper', ...).
     _usage = None
 
+    #: The component keeps no state on its instances, so the same instance
+    #: is returned to all the callers of a :class:`WorkContext`
+    _stateless = False
+
+    #: Log the calls of the methods of the component lasting longer than
+    #: the ``slow_call_threshold`` of the components registry
+    _log_slow_calls = False
+    #: Names of the methods logged when they are slow, None for all the
+    #: public methods; the names of the methods the component does not
+    #: implement are ignored
+    _slow_call_methods = None
+    #: Duration in seconds of the slow calls, set on the instances of the
+    #: components having ``_log_slow_calls``
+    _slow_call_threshold = None
+
     def __init__(self, work_context):
         super().__init__()
         self.work = work_context
@@ -712,7 +2001,8 @@ class AbstractComponent(metaclass=MetaComponent):
         Beware, if the lookups from usage, model and collection are
         cached, the calls to :meth:`_component_match` are executed
         each time we get components. Heavy computation should be
-        avoided.
+        avoided. Components which do not override this method are
+        never evaluated.
 
         :param work: the :class:`WorkContext` we are working with
 
@@ -755,6 +2045,54 @@ class AbstractComponent(metaclass=MetaComponent):
         """
         return self.work.many_components(usage=usage, model_name=model_name, **kw)
 
+    def _watch_slow_calls(self, threshold):
+        """Log the calls of the methods lasting longer than ``threshold``
+
+        Called by the :class:`WorkContext` on the components having
+        ``_log_slow_calls`` when the registry has a ``slow_call_threshold``.
+        """
+        self._slow_call_threshold = threshold
+        method_names = self._slow_call_methods
+        if method_names is None:
+            method_names = _component_public_methods(type(self))
+        for name in method_names:
+            method = getattr(self, name, None)
+            if method is None:
+                continue
+            setattr(self, name, self._slow_call_watcher(name, method, threshold))
+
+    def _slow_call_watcher(self, method_name, method, threshold):
+        @functools.wraps(method)
+        def watcher(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                if elapsed >= threshold:
+                    self._log_slow_call(method_name, elapsed)
+
+        return watcher
+
+    def _log_slow_call(self, method_name, elapsed):
+        """Log a call of a method which lasted ``elapsed`` seconds"""
+        try:
+            collection = self.collection
+        except ValueError:
+            # event work contexts may have no collection
+            collection = None
+        _logger.warning(
+            "Slow component call: component=%s method=%s usage=%s model=%s "
+            "collection=%s collection_id=%s elapsed=%.3f",
+            self._name,
+            method_name,
+            self._usage,
+            self.work.model_name,
+            collection._name if collection is not None else None,
+            collection.id if collection is not None else None,
+            elapsed,
+        )
+
     def __str__(self):
         return "Component(%s)" % self._name
 
@@ -822,6 +2160,12 @@ class AbstractComponent(metaclass=MetaComponent):
         #   class A2(Component):
         #       _inherit = 'a'
 
+        if registry.frozen:
+            raise RegistryFrozenError(
+                "Cannot build component %r: the registry is frozen." % cls
+            )
+        start = time.perf_counter()
+
         # determine inherited components
         parents = cls._inherit
         if isinstance(parents, str):
@@ -850,7 +2194,7 @@ class AbstractComponent(metaclass=MetaComponent):
         if name in parents:
             if name not in registry:
                 raise TypeError("Component %r does not exist in registry." % name)
-            ComponentClass = registry[name]
+            ComponentClass = registry._extensible_component(name)
             ComponentClass._build_component_check_base(cls)
             check_parent = ComponentClass._build_component_check_parent
         else:
@@ -864,6 +2208,7 @@ class AbstractComponent(metaclass=MetaComponent):
                     "_inherit_children": OrderedSet(),
                 },
             )
+            _built_components.add(ComponentClass)
             check_parent = cls._build_component_check_parent
 
         # determine all the classes the component should inherit from
@@ -881,12 +2226,15 @@ class AbstractComponent(metaclass=MetaComponent):
             else:
                 check_parent(cls, parent_class)
                 bases.add(parent_class)
-                parent_class._inherit_children.add(name)
+                registry._add_inherit_child(parent_class, name)
         ComponentClass.__bases__ = tuple(bases)
 
+        hooks_start = time.perf_counter()
         ComponentClass._complete_component_build()
+        hooks_time = time.perf_counter() - hooks_start
 
         registry[name] = ComponentClass
+        registry._add_build_time(name, time.perf_counter() - start, hooks_time)
 
         return ComponentClass
 
@@ -912,6 +2260,27 @@ class AbstractComponent(metaclass=MetaComponent):
             )
             raise TypeError(msg % (cls, component_class._name, parent_class._name))
 
+    @classmethod
+    def _prewarm_component_cache(cls, registry):
+        """Fill the caches of the component class
+
+        Called by :meth:`ComponentRegistry.prewarm` for every component
+        of the registry once its lookup cache is filled. Nothing is done in
+        the base Component, but a Component keeping a cache can inherit the
+        method to fill it.
+        """
+
+    @classmethod
+    def _component_registry_ready(cls, registry):
+        """Prepare the component for a registry ready to be used
+
+        Called by :meth:`ComponentRegistry.freeze` for every component loaded
+        in the registry, once all the components are loaded and before the
+        registry is used by the builder. Nothing is done in the base
+        Component, but a Component can inherit the method to compute what
+        it needs from the other components of the registry.
+        """
+
     @classmethod
     def _complete_component_build(cls):
         """Complete build of the new component class
@@ -16,3 +16,7 @@ class SeveralComponentError(ComponentException):
 
 class RegistryNotReadyError(ComponentException):
     """Component registry not ready yet for given DB."""
+
+
+class RegistryFrozenError(ComponentException):
+    """Component registry is frozen and cannot be modified anymore."""
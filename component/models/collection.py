@@ -13,11 +13,14 @@ to use in the `_collection` of the Components usable for the Backend.
 
 """
 
+import logging
 from contextlib import contextmanager
 
 from odoo import models
 
-from ..core import WorkContext
+from ..core import ComponentProfiler, WorkContext
+
+_logger = logging.getLogger(__name__)
 
 
 class Collection(models.AbstractModel):
@@ -91,6 +94,11 @@ class Collection(models.AbstractModel):
                             ) as work:
                         yield work
 
+        When the ``components_profile`` key is set in the context, the
+        calls of the methods of the components are measured during the
+        work session (see :class:`~odoo.addons.component.core.ComponentProfiler`)
+        and the report is logged at the end.
+
         """
         self.ensure_one()
         # Allow propagation of custom component registry via context
@@ -98,4 +106,16 @@ class Collection(models.AbstractModel):
         components_registry = self.env.context.get("components_registry")
         if components_registry:
             kwargs["components_registry"] = components_registry
-        yield WorkContext(model_name=model_name, collection=self, **kwargs)
+        profiler = None
+        if self.env.context.get("components_profile") and not kwargs.get(
+            "components_profiler"
+        ):
+            profiler = kwargs["components_profiler"] = ComponentProfiler()
+        work = WorkContext(model_name=model_name, collection=self, **kwargs)
+        if profiler is None:
+            yield work
+            return
+        try:
+            yield work
+        finally:
+            _logger.info("Components profile of %s: %s", work, profiler.report())
@@ -3,3 +3,6 @@ from . import test_component
 from . import test_lookup
 from . import test_work_on
 from . import test_utils
+from . import test_cache
+from . import test_builder
+from . import test_benchmark
@@ -8,7 +8,38 @@ import odoo
 from odoo import api
 from odoo.tests import common
 
-from odoo.addons.component.core import ComponentRegistry, MetaComponent, _get_addon_name
+from odoo.addons.component.core import (
+    ComponentRegistry,
+    MetaComponent,
+    _component_databases,
+    _get_addon_name,
+)
+
+# Registries of components built for the tests, by addons, which are cloned
+# by the test cases (see ComponentRegistry.clone)
+_registry_snapshots = {}
+
+
+def _get_registry_snapshot(builder, states=None, exclude_addons=None):
+    module_names = builder._get_components_modules(
+        states=states, exclude_addons=exclude_addons
+    )
+    key = tuple(
+        (module_name, tuple(MetaComponent._modules_components[module_name]))
+        for module_name in ["component"] + module_names
+    )
+    snapshot = _registry_snapshots.get(key)
+    if snapshot is None:
+        snapshot = ComponentRegistry()
+        # 'component' may not be in the addons when it is not installed yet
+        snapshot.load_components("component")
+        # not shared with the registries of the databases
+        for module_name in module_names:
+            snapshot.load_components(module_name)
+        snapshot.ready = True
+        snapshot.freeze()
+        _registry_snapshots[key] = snapshot
+    return snapshot
 
 
 @contextmanager
@@ -28,14 +59,16 @@ class ComponentMixin:
     def setUpComponent(cls):
         with new_rollbacked_env() as env:
             builder = env["component.builder"]
-            # build the components of every installed addons
-            comp_registry = builder._init_global_registry()
-            cls._components_registry = comp_registry
+            # build the components of every installed addons, once for all
+            # the test cases, and use a clone of them.
             # ensure that we load only the components of the 'installed'
             # modules, not 'to install', which means we load only the
             # dependencies of the tested addons, not the siblings or
             # children addons
-            builder.build_registry(comp_registry, states=("installed",))
+            snapshot = _get_registry_snapshot(builder, states=("installed",))
+            comp_registry = snapshot.clone()
+            _component_databases[env.cr.dbname] = comp_registry
+            cls._components_registry = comp_registry
             # build the components of the current tested addon
             current_addon = _get_addon_name(cls.__module__)
             env["component.builder"].load_components(current_addon)
@@ -134,23 +167,21 @@ class ComponentRegistryCase:
             MetaComponent._modules_components
         )
 
-        # it will be our temporary component registry for our test session
-        class_or_instance.comp_registry = ComponentRegistry()
-
-        # it builds the 'final component' for every component of the
-        # 'component' addon and push them in the component registry
-        class_or_instance.comp_registry.load_components("component")
-        # build the components of every installed addons already installed
+        # it will be our temporary component registry for our test session,
+        # a clone of the 'final component' of every component of the
+        # 'component' addon and of every installed addons already installed
         # but the current addon (when running with pytest/nosetest, we
         # simulate the --test-enable behavior by excluding the current addon
         # which is in 'to install' / 'to upgrade' with --test-enable).
+        # They are built once for all the test cases.
         current_addon = _get_addon_name(class_or_instance.__module__)
         with new_rollbacked_env() as env:
-            env["component.builder"].build_registry(
-                class_or_instance.comp_registry,
+            snapshot = _get_registry_snapshot(
+                env["component.builder"],
                 states=("installed",),
                 exclude_addons=[current_addon],
             )
+        class_or_instance.comp_registry = snapshot.clone()
 
         # Fake that we are ready to work with the registry
         # normally, it is set to True and the end of the build
@@ -0,0 +1,207 @@
+# Copyright 2026 Odoo Community Association (OCA)
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+"""Benchmark of the components registry
+
+It is not run with the standard tests, run it with::
+
+    odoo -d db -i component --test-tags component_benchmark --stop-after-init
+
+The results are appended as JSON lines to the file given by the
+``COMPONENT_BENCHMARK_FILE`` environment variable (by default
+``component_benchmark.jsonl`` in the temporary directory), so they can be
+compared between releases.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+from odoo import release
+from odoo.tests.common import tagged
+
+from odoo.addons.component.core import (
+    DEFAULT_CACHE_SIZE,
+    Component,
+    ComponentRegistry,
+    MetaComponent,
+    WorkContext,
+)
+
+from .common import TransactionComponentRegistryCase
+
+_logger = logging.getLogger(__name__)
+
+
+def time_calls(function, arguments, repeat=1):
+    """Return the mean time of the calls, in microseconds"""
+    start = time.perf_counter()
+    for __ in range(repeat):
+        for argument in arguments:
+            function(argument)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(arguments)) * 1e6
+
+
+def write_benchmark_results(env, module_name, results):
+    """Append the results of a benchmark to the benchmark file
+
+    With the versions of Odoo and of the addon ``module_name``.
+    """
+    path = os.environ.get("COMPONENT_BENCHMARK_FILE") or os.path.join(
+        tempfile.gettempdir(), "component_benchmark.jsonl"
+    )
+    module = env["ir.module.module"].search([("name", "=", module_name)])
+    with open(path, "a") as benchmark_file:
+        for result in results:
+            result.update(
+                odoo_version=release.version,
+                module_version=module.latest_version,
+                timestamp=time.time(),
+            )
+            benchmark_file.write(json.dumps(result, sort_keys=True) + "\n")
+    _logger.info("Component benchmark results written in %s", path)
+
+
+@tagged("-standard", "component_benchmark")
+class TestBenchmark(TransactionComponentRegistryCase):
+    """Measure the build and the lookups of synthetic registries"""
+
+    #: (collections, usages, models) of the synthetic registries
+    sizes = [(1, 10, 5), (5, 20, 10), (10, 50, 20)]
+    #: number of times every lookup is repeated for the warm latency
+    repeat = 100
+
+    def setUp(self):
+        super().setUp()
+        self._setup_registry(self)
+
+    def tearDown(self):
+        self._teardown_registry(self)
+        super().tearDown()
+
+    def _generate_modules(self, collections, usages, model_names):
+        """Register the components of a synthetic addon by collection
+
+        Every addon has a component by usage and model, and a generic
+        component by usage, for any model. The first collection is
+        ``collection.base``, so the components can be used in a
+        :class:`WorkContext`.
+        """
+        modules = []
+        for collection_index in range(collections):
+            if collection_index:
+                collection_name = "bench.collection.%d" % collection_index
+            else:
+                collection_name = "collection.base"
+            component_classes = []
+            for usage_index in range(usages):
+                for model_name in model_names + [None]:
+                    name = "bench.{}.{}.{}".format(
+                        collection_index, usage_index, model_name or "any"
+                    )
+                    component_class = type(
+                        name,
+                        (Component,),
+                        {
+                            "__module__": __name__,
+                            "_name": name,
+                            "_collection": collection_name,
+                            "_usage": "bench.usage.%d" % usage_index,
+                            "_apply_on": model_name,
+                        },
+                    )
+                    component_classes.append(component_class)
+            module = "component_benchmark_%d" % collection_index
+            MetaComponent._modules_components[module] = component_classes
+            modules.append(module)
+        return modules
+
+    def _benchmark_registry(self, collections, usages, models):
+        model_names = sorted(self.env.registry)[:models]
+        modules = self._generate_modules(collections, usages, model_names)
+        lookup_keys = [
+            (collection_name, "bench.usage.%d" % usage_index, model_name)
+            for collection_name in ["collection.base", None]
+            for usage_index in range(usages)
+            for model_name in model_names
+        ]
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        registry = ComponentRegistry(
+            cachesize=max(DEFAULT_CACHE_SIZE, len(lookup_keys))
+        )
+        for module in ["component"] + modules:
+            registry.load_components(module)
+        build_time = time.perf_counter() - start
+        memory, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        registry.ready = True
+
+        cold_lookup = time_calls(lambda key: registry.lookup(*key), lookup_keys)
+        warm_lookup = time_calls(
+            lambda key: registry.lookup(*key), lookup_keys, repeat=self.repeat
+        )
+        work = WorkContext(
+            model_name=model_names[0],
+            collection=self.collection,
+            components_registry=registry,
+        )
+        component_keys = [
+            ("bench.usage.%d" % usage_index, model_name)
+            for usage_index in range(usages)
+            for model_name in model_names
+        ]
+        component = time_calls(
+            lambda key: work.component(usage=key[0], model_name=key[1]),
+            component_keys,
+            repeat=self.repeat,
+        )
+        return {
+            "benchmark": "component_registry",
+            "collections": collections,
+            "usages": usages,
+            "models": models,
+            "components": len(list(registry)),
+            "build_s": build_time,
+            "build_memory_bytes": memory,
+            "build_peak_memory_bytes": peak_memory,
+            "cold_lookup_us": cold_lookup,
+            "warm_lookup_us": warm_lookup,
+            "component_us": component,
+        }
+
+    def _benchmark_build_registry(self):
+        builder = self.env["component.builder"]
+        registry = ComponentRegistry()
+        start = time.perf_counter()
+        # every component is built
+        with mock.patch.multiple(
+            type(builder),
+            _components_registry_incremental=False,
+            _components_registry_shared=False,
+        ):
+            builder.build_registry(registry, states=("installed",))
+        return {
+            "benchmark": "build_registry",
+            "components": len(list(registry)),
+            "build_s": time.perf_counter() - start,
+        }
+
+    def test_benchmark(self):
+        results = [self._benchmark_build_registry()]
+        for collections, usages, models in self.sizes:
+            result = self._benchmark_registry(collections, usages, models)
+            _logger.info("Component benchmark: %s", result)
+            self.assertEqual(
+                # the components of the benchmark and 'base'
+                collections * usages * (models + 1) + 1,
+                result["components"],
+            )
+            results.append(result)
+        write_benchmark_results(self.env, "component", results)
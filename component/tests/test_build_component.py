@@ -6,7 +6,13 @@
 
 from unittest import mock
 
-from odoo.addons.component.core import AbstractComponent, Component
+from odoo.addons.component.core import (
+    AbstractComponent,
+    Component,
+    ComponentRegistry,
+    MetaComponent,
+    StatsLRUCache,
+)
 
 from .common import TransactionComponentRegistryCase
 
@@ -283,3 +289,286 @@ class TestBuildComponent(TransactionComponentRegistryCase):
         msg = ".*transforms the abstract component.*into a non-abstract.*"
         with self.assertRaisesRegex(TypeError, msg):
             Component1bis._build_component(self.comp_registry)
+
+    def test_load_components_from(self):
+        """Reuse the unchanged components of a previous registry"""
+
+        class Speaker(AbstractComponent):
+            _name = "speaker"
+            _collection = "foobar"
+            _usage = "speaker"
+
+        class Foo(Component):
+            _name = "foo"
+            _inherit = "speaker"
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "foobar"
+            _usage = "listener"
+
+        class Speaker2(AbstractComponent):
+            _inherit = "speaker"
+            _apply_on = ["res.partner"]
+
+        modules = MetaComponent._modules_components
+        modules["test_reuse_a"] = [Speaker, Foo]
+        modules["test_reuse_b"] = [Bar]
+        modules["test_reuse_c"] = [Speaker2]
+        addons = ["component", "test_reuse_a", "test_reuse_b"]
+        previous = ComponentRegistry()
+        for addon in addons:
+            previous.load_components(addon)
+        previous.ready = True
+        previous.lookup("foobar", usage="speaker")
+        previous.lookup("foobar", usage="listener")
+
+        # nothing changed
+        registry = ComponentRegistry()
+        self.assertFalse(registry.load_components_from(previous, addons))
+        for name in previous:
+            self.assertIs(previous[name], registry[name])
+        self.assertIn(("foobar", "speaker", None), registry._cache)
+        self.assertIn(("foobar", "listener", None), registry._cache)
+
+        # 'speaker' is extended by a new addon
+        addons.append("test_reuse_c")
+        registry = ComponentRegistry()
+        self.assertEqual(
+            {"speaker", "foo"}, registry.load_components_from(previous, addons)
+        )
+        self.assertIs(previous["bar"], registry["bar"])
+        self.assertIsNot(previous["foo"], registry["foo"])
+        self.assertEqual(["res.partner"], registry["foo"]._apply_on)
+        self.assertNotIn(("foobar", "speaker", None), registry._cache)
+        self.assertIn(("foobar", "listener", None), registry._cache)
+
+        # same components as loaded without the previous registry
+        eager_registry = ComponentRegistry()
+        for addon in addons:
+            eager_registry.load_components(addon)
+        self.assertEqual(list(eager_registry), list(registry))
+        for name in eager_registry:
+            self.assertEqual(
+                [base.__name__ for base in eager_registry[name].__mro__],
+                [base.__name__ for base in registry[name].__mro__],
+            )
+
+    def test_load_components_shared(self):
+        """Components built the same way are shared between registries"""
+
+        class Foo(Component):
+            _name = "foo"
+
+        class Bar(Component):
+            _name = "bar"
+
+        class Foo2(Component):
+            _inherit = "foo"
+
+        modules = MetaComponent._modules_components
+        modules["test_reuse_a"] = [Foo]
+        modules["test_reuse_b"] = [Bar]
+        modules["test_reuse_c"] = [Foo2]
+        registry = ComponentRegistry()
+        # 'base' may have been built by other registries
+        self.assertLessEqual(
+            {"foo", "bar"},
+            registry.load_components_from(
+                None, ["component", "test_reuse_a", "test_reuse_b"]
+            ),
+        )
+        self.assertEqual(1, registry.build_profile()["foo"]["builds"])
+
+        # another registry, without 'bar' and with an extension of 'foo'
+        other_registry = ComponentRegistry()
+        self.assertEqual(
+            {"foo"},
+            other_registry.load_components_from(
+                None, ["component", "test_reuse_a", "test_reuse_c"]
+            ),
+        )
+        self.assertIs(registry["base"], other_registry["base"])
+        self.assertIsNot(registry["foo"], other_registry["foo"])
+        self.assertEqual(["foo"], list(other_registry.build_profile()))
+        self.assertEqual(2, other_registry.build_profile()["foo"]["builds"])
+
+    def test_load_components_shared_cache(self):
+        """A component reused from another registry invalidates the lookups"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "foobar"
+            _usage = "speaker"
+
+        class X(Component):
+            _name = "x"
+            _collection = "foobar"
+            _usage = "speaker"
+
+        modules = MetaComponent._modules_components
+        modules["test_reuse_a"] = [Foo]
+        modules["test_reuse_x"] = [X]
+        previous = ComponentRegistry()
+        previous.load_components_from(None, ["component", "test_reuse_a"])
+        previous.ready = True
+        components = previous.lookup("foobar", usage="speaker")
+        self.assertEqual(["foo"], [c._name for c in components])
+        # 'x' is built by another registry
+        other_registry = ComponentRegistry()
+        other_registry.load_components_from(
+            None, ["component", "test_reuse_a", "test_reuse_x"]
+        )
+
+        # the addon of 'x' is installed
+        registry = ComponentRegistry()
+        registry.load_components_from(
+            previous, ["component", "test_reuse_a", "test_reuse_x"]
+        )
+        self.assertIs(other_registry["x"], registry["x"])
+        self.assertNotIn(("foobar", "speaker", None), registry._cache)
+        registry.ready = True
+        components = registry.lookup("foobar", usage="speaker")
+        self.assertEqual(["foo", "x"], [c._name for c in components])
+
+    def test_clone(self):
+        """A clone shares the components until they are extended"""
+
+        class Foo(Component):
+            _name = "foo"
+
+        class Bar(Component):
+            _name = "bar"
+            _inherit = "foo"
+
+        class Foo2(Component):
+            _inherit = "foo"
+            _usage = "speaker"
+
+        self._build_components(Foo, Bar)
+        self.comp_registry.ready = True
+        self.comp_registry.freeze()
+        clone = self.comp_registry.clone()
+        self.assertEqual(list(self.comp_registry), list(clone))
+        self.assertIs(self.comp_registry["bar"], clone["bar"])
+
+        Foo2._build_component(clone)
+        # 'foo' and 'bar' are copied in the clone before 'foo' is extended
+        self.assertIsNot(self.comp_registry["foo"], clone["foo"])
+        self.assertIsNot(self.comp_registry["bar"], clone["bar"])
+        self.assertIs(self.comp_registry["base"], clone["base"])
+        self.assertEqual("speaker", clone["bar"]._usage)
+        self.assertIsNone(self.comp_registry["bar"]._usage)
+        self.assertIn(clone["foo"], clone["bar"].__bases__)
+
+    def test_clone_inherit_order(self):
+        """A component inheriting from a later component is copied after it"""
+
+        class A(Component):
+            _name = "a"
+
+        class B(Component):
+            _name = "b"
+
+        class A2(Component):
+            _name = "a"
+            _inherit = ["a", "b"]
+
+        class B2(Component):
+            _inherit = "b"
+            _usage = "extended"
+
+        self._build_components(A, B, A2)
+        self.comp_registry.ready = True
+        self.comp_registry.freeze()
+        clone = self.comp_registry.clone()
+        B2._build_component(clone)
+        self.assertTrue(issubclass(clone["a"], clone["b"]))
+        self.assertEqual("extended", clone["a"]._usage)
+        self.assertIsNone(self.comp_registry["a"]._usage)
+
+    def test_clone_inherit_children(self):
+        """The children of the components of a clone are its own"""
+
+        class Foo(Component):
+            _name = "foo"
+
+        class Bar(Component):
+            _name = "bar"
+            _inherit = "foo"
+
+        class Foo2(Component):
+            _inherit = "foo"
+            _usage = "speaker"
+
+        self._build_components(Foo)
+        self.comp_registry.ready = True
+        self.comp_registry.freeze()
+        clone = self.comp_registry.clone()
+        Bar._build_component(clone)
+        # the parents are not copied to add a child
+        self.assertIs(self.comp_registry["foo"], clone["foo"])
+        self.assertIs(self.comp_registry["base"], clone["base"])
+        self.assertNotIn("bar", self.comp_registry["foo"]._inherit_children)
+        self.assertNotIn("bar", self.comp_registry["base"]._inherit_children)
+        self.assertIn(clone["foo"], clone["bar"].__bases__)
+        # until they are extended
+        Foo2._build_component(clone)
+        self.assertIn("bar", clone["foo"]._inherit_children)
+        self.assertNotIn("bar", self.comp_registry["foo"]._inherit_children)
+
+    def test_clone_inherit_copied(self):
+        """The components built in a clone inherit from the copied classes"""
+
+        class Mapper(AbstractComponent):
+            _name = "test.mapper"
+
+        class ImportMapper(AbstractComponent):
+            _name = "test.import.mapper"
+            _inherit = "test.mapper"
+
+        class MyMapper(Component):
+            _name = "my.mapper"
+            _inherit = "test.import.mapper"
+
+        class Mapper2(AbstractComponent):
+            _inherit = "test.mapper"
+            _usage = "extended"
+
+        self._build_components(Mapper, ImportMapper)
+        self.comp_registry.ready = True
+        self.comp_registry.freeze()
+        clone = self.comp_registry.clone()
+        MyMapper._build_component(clone)
+        Mapper2._build_component(clone)
+        self.assertTrue(issubclass(clone["test.import.mapper"], clone["test.mapper"]))
+        self.assertIn(clone["test.import.mapper"], clone["my.mapper"].__bases__)
+        self.assertEqual("extended", clone["my.mapper"]._usage)
+        self.assertIsNone(self.comp_registry["test.import.mapper"]._usage)
+
+    def test_clone_cache_size(self):
+        """A clone has the same size of lookup cache"""
+        registry = ComponentRegistry(cachesize=10, cache_autosize=True)
+        registry.load_components("component")
+        registry.ready = True
+        clone = registry.clone()
+        self.assertEqual(10, clone._cache._maxsize)
+        self.assertTrue(clone._cache._autosize)
+
+    def test_clone_component_cache(self):
+        """A clone has its own caches of components"""
+
+        class Cached(Component):
+            _name = "cached"
+
+            @classmethod
+            def _complete_component_build(cls):
+                super()._complete_component_build()
+                cls._cache = StatsLRUCache()
+
+        self._build_components(Cached)
+        self.comp_registry["cached"]._cache["key"] = "value"
+        clone = self.comp_registry.clone()
+        self.assertIsNot(self.comp_registry["cached"], clone["cached"])
+        self.assertNotIn("key", clone["cached"]._cache)
+        self.assertIs(self.comp_registry["base"], clone["base"])
@@ -0,0 +1,135 @@
+# Copyright 2026 Odoo Community Association (OCA)
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+from unittest import mock
+
+from odoo.addons.component import builder
+from odoo.addons.component.core import _component_databases
+
+from .common import TransactionComponentRegistryCase
+
+
+class TestBuilder(TransactionComponentRegistryCase):
+    """Test the build of the global registries of components"""
+
+    def setUp(self):
+        super().setUp()
+        self.builder = self.env["component.builder"]
+        self.dbname = self.env.cr.dbname
+        # do not alter the registries used by the other tests
+        patcher = mock.patch.dict(_component_databases)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(
+            builder, "_shared_registries", builder.weakref.WeakValueDictionary()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_build_registry(self):
+        """The registries are built by build_registry()"""
+        builder_class = type(self.builder)
+        with mock.patch.object(
+            builder_class,
+            "build_registry",
+            autospec=True,
+            side_effect=builder_class.build_registry,
+        ) as build_registry:
+            self.builder._register_hook()
+        registry = _component_databases[self.dbname]
+        build_registry.assert_called_once_with(self.builder, registry)
+        self.assertTrue(registry.ready)
+        self.assertTrue(registry.frozen)
+
+    def test_shared_registry(self):
+        """Databases with the same addons share the same components"""
+        self.builder._register_hook()
+        registry = _component_databases[self.dbname]
+        registry.lookup(usage="foo")
+        # same addons for another database
+        del _component_databases[self.dbname]
+        self.builder._register_hook()
+        new_registry = _component_databases[self.dbname]
+        self.assertIsNot(registry, new_registry)
+        for name in registry:
+            self.assertIs(registry[name], new_registry[name])
+        self.assertIs(registry.index, new_registry.index)
+        # the statistics of the lookups are kept by database
+        new_registry.lookup(usage="foo")
+        self.assertEqual(1, new_registry.cache_stats()["lookup"]["hits"])
+        self.assertEqual(0, registry.cache_stats()["lookup"]["hits"])
+
+    def test_not_shared_registry(self):
+        """Different addons or sharing disabled do not share the registry"""
+        self.builder._register_hook()
+        registry = _component_databases[self.dbname]
+        registry.lookup(usage="foo")
+        del _component_databases[self.dbname]
+        with mock.patch.object(
+            type(self.builder),
+            "_get_components_modules",
+            return_value=self.builder._get_components_modules()[:-1],
+        ):
+            self.builder._register_hook()
+        self.assertIsNot(registry.index, _component_databases[self.dbname].index)
+        del _component_databases[self.dbname]
+        with mock.patch.object(
+            type(self.builder), "_components_registry_shared", False
+        ):
+            self.builder._register_hook()
+        new_registry = _component_databases[self.dbname]
+        self.assertIsNot(registry.index, new_registry.index)
+        self.assertNotIn((None, "foo", None), new_registry._cache)
+
+    def test_not_incremental_registry(self):
+        """Without reuse, every component is built in the registry"""
+        with mock.patch.multiple(
+            type(self.builder),
+            _components_registry_incremental=False,
+            _components_registry_shared=False,
+        ):
+            self.builder._register_hook()
+        registry = _component_databases[self.dbname]
+        self.assertTrue(registry.ready)
+        self.assertEqual(
+            set(registry._loaded_modules),
+            set(self.builder._get_components_modules()),
+        )
+
+    def test_lazy_registry(self):
+        """A lazy registry loads the components when they are needed"""
+        with mock.patch.object(type(self.builder), "_components_registry_lazy", True):
+            self.builder._register_hook()
+        registry = _component_databases[self.dbname]
+        self.assertTrue(registry.frozen)
+        self.assertFalse(registry._loaded_modules)
+        self.assertTrue(registry["base"])
+        self.assertIn("component", registry._loaded_modules)
+        self.assertLessEqual(
+            set(registry._loaded_modules),
+            set(self.builder._get_components_modules()),
+        )
+
+    def test_incremental_registry(self):
+        """A rebuilt registry reuses the components of the previous one"""
+        with mock.patch.object(
+            type(self.builder), "_components_registry_shared", False
+        ):
+            self.builder._register_hook()
+            registry = _component_databases[self.dbname]
+            self.builder._register_hook()
+        new_registry = _component_databases[self.dbname]
+        self.assertIsNot(registry, new_registry)
+        self.assertIs(registry["base"], new_registry["base"])
+
+    def test_release_registry(self):
+        """The previous registry of a database is released"""
+        with mock.patch.object(
+            type(self.builder), "_components_registry_shared", False
+        ):
+            self.builder._register_hook()
+            registry = _component_databases[self.dbname]
+            registry.lookup(usage="foo")
+            self.builder._register_hook()
+        self.assertIsNot(registry, _component_databases[self.dbname])
+        self.assertEqual(0, len(registry._cache))
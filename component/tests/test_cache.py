@@ -0,0 +1,105 @@
+# Copyright 2026 Odoo Community Association (OCA)
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+import threading
+import unittest
+
+from odoo.tests.common import MetaCase, tagged
+
+from odoo.addons.component.core import StatsLRUCache
+
+
+@tagged("standard", "at_install")
+class TestStatsLRUCache(unittest.TestCase, MetaCase("DummyCase", (), {})):
+    """Test the cache used for the lookups"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_sequence = 0
+
+    def test_stats(self):
+        """Hits, misses and evictions are counted"""
+        cache = StatsLRUCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(1, cache["a"])
+        with self.assertRaises(KeyError):
+            cache["c"]  # pylint: disable=W0104
+        # 'b' is the least recently used
+        cache["c"] = 3
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(
+            {
+                "hits": 1,
+                "misses": 1,
+                "evictions": 1,
+                "currsize": 2,
+                "maxsize": 2,
+                "warmup": False,
+            },
+            cache.stats(),
+        )
+
+    def test_autosize(self):
+        """The size is computed at the end of the warm-up"""
+        cache = StatsLRUCache(autosize=True, warmup=300)
+        for key in range(100):
+            with self.assertRaises(KeyError):
+                cache[key]  # pylint: disable=W0104
+            cache[key] = key
+        self.assertIsNone(cache.maxsize)
+        self.assertTrue(cache.stats()["warmup"])
+        for key in range(200):
+            cache[key % 100]  # pylint: disable=W0104
+        self.assertFalse(cache.stats()["warmup"])
+        self.assertEqual(150, cache.maxsize)
+        self.assertEqual(100, cache.currsize)
+        for key in range(100, 200):
+            cache[key] = key
+        self.assertLessEqual(cache.currsize, 150)
+        self.assertEqual(200 - cache.currsize, cache.stats()["evictions"])
+
+    def test_evict_batch(self):
+        """A full cache evicts its least recently used entries at once"""
+        cache = StatsLRUCache(maxsize=20)
+        for key in range(20):
+            cache[key] = key
+        for key in range(10):
+            cache[key]  # pylint: disable=W0104
+        cache[20] = 20
+        # down to 90% of the size, the entries read are kept
+        self.assertEqual(18, cache.currsize)
+        self.assertEqual(3, cache.stats()["evictions"])
+        self.assertEqual(
+            list(range(13, 20)) + list(range(10)) + [20],
+            [key for key, __ in cache.items()],
+        )
+
+    def test_threads(self):
+        """Reads and writes from many threads"""
+        cache = StatsLRUCache(maxsize=16)
+        errors = []
+
+        def use_cache(offset):
+            try:
+                for iteration in range(1000):
+                    key = (offset + iteration) % 40
+                    try:
+                        if cache[key] != key * 2:
+                            errors.append(key)
+                    except KeyError:
+                        cache[key] = key * 2
+            except Exception as err:
+                errors.append(err)
+
+        threads = [
+            threading.Thread(target=use_cache, args=(offset,)) for offset in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        self.assertLessEqual(len(cache), 16)
+        self.assertEqual(len(cache), len(cache.items()))
@@ -3,7 +3,7 @@
 
 from contextlib import contextmanager
 
-from odoo.addons.component.core import Component
+from odoo.addons.component.core import Component, ComponentProfiler
 from odoo.addons.component.exception import NoComponentError, SeveralComponentError
 
 from .common import TransactionComponentRegistryCase
@@ -127,6 +127,32 @@ class TestComponent(TransactionComponentRegistryCase):
             with self.assertRaisesRegex(NoComponentError, msg):
                 base.component_by_name("foo")
 
+    def test_component_get_by_name_cached(self):
+        """The checks of component_by_name are kept in the registry"""
+        msg = (
+            "Component with name 'component2' can't be used "
+            "for model 'res.partner'.*"
+        )
+        with self.get_base() as base:
+            base.component_by_name("component1")
+            key = ("component1", "collection.base", "res.partner")
+            self.assertIs(
+                self.comp_registry["component1"],
+                self.comp_registry._by_name_cache[key],
+            )
+            self.assertEqual("component1", base.component_by_name("component1")._name)
+            for __ in range(2):
+                with self.assertRaisesRegex(NoComponentError, msg):
+                    base.component_by_name("component2")
+
+            # a new component is found
+            class Foo(Component):
+                _name = "foo"
+
+            self._build_components(Foo)
+            self.assertFalse(self.comp_registry._by_name_cache)
+            self.assertEqual("foo", base.component_by_name("foo")._name)
+
     def test_component_by_usage_same_model(self):
         """Use component(usage=...) on the same model"""
         # we ask for a component having _usage == 'for.test', and
@@ -386,3 +412,191 @@ class TestComponent(TransactionComponentRegistryCase):
             # _component_match method
             comp = base.component(usage="speaker", model_name=self.env["res.partner"])
             self.assertEqual("bar", comp._name)
+
+    def test_component_match_not_overridden(self):
+        """_component_match is evaluated only when overridden"""
+        calls = []
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+            @classmethod
+            def _component_match(cls, work, **kw):
+                calls.append(cls._name)
+                return True
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+        self._build_components(Foo, Bar)
+
+        overrides = self.comp_registry.component_match_overrides
+        self.assertIn(self.comp_registry["foo"], overrides)
+        self.assertNotIn(self.comp_registry["bar"], overrides)
+        self.assertNotIn(self.comp_registry["component1"], overrides)
+
+        with self.get_base() as base:
+            comps = base.many_components(usage="speaker")
+            self.assertEqual(["foo", "bar"], [c._name for c in comps])
+            self.assertEqual(["foo"], calls)
+            comps = base.many_components(usage="for.test")
+            self.assertEqual(["component1"], [c._name for c in comps])
+            self.assertEqual(["foo"], calls)
+
+    def test_component_match_staticmethod(self):
+        """_component_match can be overridden with a staticmethod"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+            @staticmethod
+            def _component_match(work, **kw):
+                return False
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+        self._build_components(Foo, Bar)
+
+        self.assertIn(
+            self.comp_registry["foo"], self.comp_registry.component_match_overrides
+        )
+        with self.get_base() as base:
+            comps = base.many_components(usage="speaker")
+            self.assertEqual(["bar"], [c._name for c in comps])
+
+    def test_component_stateless(self):
+        """The instances of stateless components are shared"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+            _stateless = True
+
+        self._build_components(Foo)
+
+        with self.get_base() as base:
+            foo = base.component(usage="speaker")
+            self.assertIs(foo, base.component(usage="speaker"))
+            self.assertIs(foo, base.component_by_name("foo"))
+            self.assertIs(foo, base.work.component(usage="speaker"))
+            foo_users = base.component(usage="speaker", model_name="res.users")
+            self.assertIsNot(foo, foo_users)
+            self.assertEqual("res.users", foo_users.work.model_name)
+            self.assertIs(
+                foo_users, base.component(usage="speaker", model_name="res.users")
+            )
+            # not a stateless component
+            self.assertIsNot(
+                base.component(usage="for.test"), base.component(usage="for.test")
+            )
+
+    def test_component_profiler(self):
+        """The calls of the methods are measured by the profiler"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+            def speak(self, message):
+                return self.shout(message)
+
+            def shout(self, message):
+                return message.upper()
+
+        self._build_components(Foo)
+
+        profiler = ComponentProfiler()
+        with self.collection_record.work_on(
+            "res.partner",
+            components_registry=self.comp_registry,
+            components_profiler=profiler,
+        ) as work:
+            foo = work.component(usage="speaker")
+            self.assertEqual("HELLO", foo.speak("hello"))
+            self.assertEqual("HI", foo.shout("hi"))
+            # propagated to the other work contexts
+            work_users = work.work_on("res.users")
+            self.assertIs(profiler, work_users.components_profiler)
+            work_users.component(usage="speaker").speak("hey")
+        report = {
+            (item["component"], item["method"]): item for item in profiler.report()
+        }
+        self.assertEqual(2, report[("foo", "speak")]["calls"])
+        self.assertEqual(3, report[("foo", "shout")]["calls"])
+
+        # not profiled by default
+        with self.get_base() as base:
+            self.assertIsNone(base.work.components_profiler)
+            foo = base.component(usage="speaker")
+            self.assertNotIn("speak", vars(foo))
+
+    def test_component_slow_calls(self):
+        """The slow calls of the components are logged"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+            _log_slow_calls = True
+            _slow_call_methods = ("speak",)
+
+            def speak(self, message):
+                return message
+
+            def shout(self, message):
+                return message.upper()
+
+        self._build_components(Foo)
+
+        with self.get_base() as base:
+            foo = base.component(usage="speaker")
+            self.assertNotIn("speak", vars(foo))
+            self.assertIsNone(foo._slow_call_threshold)
+
+        # every call is slower than 0 second
+        self.comp_registry.slow_call_threshold = 0.0
+        with self.get_base() as base:
+            foo = base.component(usage="speaker")
+            with self.assertLogs("odoo.addons.component.core", "WARNING") as logs:
+                self.assertEqual("hello", foo.speak("hello"))
+            self.assertEqual(1, len(logs.output))
+            self.assertIn(
+                "component=foo method=speak usage=speaker model=res.partner "
+                "collection=collection.base",
+                logs.output[0],
+            )
+            # not a watched method
+            self.assertNotIn("shout", vars(foo))
+
+    def test_component_slow_calls_missing_method(self):
+        """The watched methods the component does not have are ignored"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+            _log_slow_calls = True
+            _slow_call_methods = ("speak", "shout")
+
+            def speak(self, message):
+                return message
+
+        self._build_components(Foo)
+
+        self.comp_registry.slow_call_threshold = 0.0
+        with self.get_base() as base:
+            foo = base.component(usage="speaker")
+            self.assertIn("speak", vars(foo))
+            self.assertNotIn("shout", vars(foo))
+            self.assertFalse(hasattr(foo, "shout"))
@@ -1,7 +1,15 @@
 # Copyright 2017 Camptocamp SA
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
 
-from odoo.addons.component.core import AbstractComponent, Component
+import threading
+
+from odoo.addons.component.core import (
+    AbstractComponent,
+    Component,
+    ComponentRegistry,
+    MetaComponent,
+)
+from odoo.addons.component.exception import RegistryFrozenError
 
 from .common import TransactionComponentRegistryCase
 
@@ -190,3 +198,288 @@ class TestLookup(TransactionComponentRegistryCase):
         # now we should find them both as the cache has been cleared
         components = self.comp_registry.lookup("foobar")
         self.assertEqual(["foo", "bar"], [c._name for c in components])
+
+    def test_lookup_order(self):
+        """Lookup returns the components in their registration order"""
+
+        class Foo(Component):
+            _name = "foo"
+            _usage = "speaker"
+            _apply_on = ["res.partner"]
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "foobar"
+            _usage = "speaker"
+
+        class Baz(Component):
+            _name = "baz"
+            _collection = "foobar"
+            _usage = "speaker"
+            _apply_on = ["res.users", "res.partner"]
+
+        self._build_components(Foo, Bar, Baz)
+
+        components = self.comp_registry.lookup(
+            "foobar", usage="speaker", model_name="res.partner"
+        )
+        self.assertEqual(["foo", "bar", "baz"], [c._name for c in components])
+        components = self.comp_registry.lookup(
+            "foobar", usage="speaker", model_name="res.users"
+        )
+        self.assertEqual(["bar", "baz"], [c._name for c in components])
+
+    def test_lookup_index_rebuilt(self):
+        """The index follows the changes of the components"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "foobar"
+            _usage = "speaker"
+
+        self._build_components(Foo)
+        self.comp_registry.ready = True
+
+        components = self.comp_registry.lookup("foobar", usage="speaker")
+        self.assertEqual(["foo"], [c._name for c in components])
+
+        # change the usage of an existing component
+        class Foo2(Component):
+            _inherit = "foo"
+            _usage = "listener"
+
+        self._build_components(Foo2)
+        self.comp_registry._cache.clear()
+
+        self.assertEqual([], self.comp_registry.lookup("foobar", usage="speaker"))
+        components = self.comp_registry.lookup("foobar", usage="listener")
+        self.assertEqual(["foo"], [c._name for c in components])
+
+    def test_lookup_frozen(self):
+        """A frozen registry returns tuples and cannot be modified"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "foobar"
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "foobar"
+
+        self._build_components(Foo)
+        components = self.comp_registry.lookup("foobar")
+        self.assertEqual(["foo"], [c._name for c in components])
+        # the cached result is returned without copy
+        self.assertIs(components, self.comp_registry.lookup("foobar"))
+
+        self.comp_registry.freeze()
+        self.assertTrue(self.comp_registry.frozen)
+        components = self.comp_registry.lookup("foobar")
+        self.assertIsInstance(components, tuple)
+        self.assertEqual(["foo"], [c._name for c in components])
+        # the same result is shared between the callers
+        self.assertIs(components, self.comp_registry.lookup("foobar"))
+
+        with self.assertRaises(RegistryFrozenError):
+            self._build_components(Bar)
+        with self.assertRaises(RegistryFrozenError):
+            self._load_module_components("not_loaded_addon")
+        with self.assertRaises(TypeError):
+            self.comp_registry._components["bar"] = Bar
+        self.assertNotIn("bar", self.comp_registry)
+
+    def test_prewarm(self):
+        """Prewarm the cache with the lookups declared by the components"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "foobar"
+            _usage = "speaker"
+            _apply_on = ["res.partner", "res.users"]
+
+        class Bar(Component):
+            _name = "bar"
+            _usage = "listener"
+
+        self._build_components(Foo, Bar)
+        self.comp_registry._cache.clear()
+        self.comp_registry.prewarm()
+
+        cache = self.comp_registry._cache
+        self.assertIn(("foobar", "speaker", "res.partner"), cache)
+        self.assertIn(("foobar", "speaker", "res.users"), cache)
+        # no collection and no model: for the models of every collection
+        self.assertIn(("foobar", "listener", "res.partner"), cache)
+        self.assertIn(("foobar", "listener", "res.users"), cache)
+        misses = cache.misses
+        components = self.comp_registry.lookup(
+            "foobar", usage="speaker", model_name="res.users"
+        )
+        self.assertEqual(["foo"], [c._name for c in components])
+        self.assertEqual(misses, cache.misses)
+
+    def test_lookup_shards(self):
+        """The lookups of a collection use their own shard of the cache"""
+        registry = ComponentRegistry(cachesize=2)
+        registry.load_components("component")
+        for index in range(4):
+            component_class = type(
+                "Component%d" % index,
+                (Component,),
+                {
+                    "__module__": __name__,
+                    "_name": "component%d" % index,
+                    "_collection": "collection%d" % (index % 2) if index < 3 else None,
+                    "_usage": "usage%d" % index,
+                },
+            )
+            component_class._build_component(registry)
+        registry.ready = True
+
+        components = registry.lookup("collection0", usage="usage0")
+        self.assertEqual(["component0"], [c._name for c in components])
+        # components without collection are in the shard of every collection
+        components = registry.lookup("collection1", usage="usage3")
+        self.assertEqual(["component3"], [c._name for c in components])
+        components = registry.lookup("collection1")
+        self.assertEqual(
+            ["component1", "component3"], sorted(c._name for c in components)
+        )
+        components = registry.lookup("unknown")
+        self.assertEqual(["component3"], [c._name for c in components])
+        # the other collections do not evict the entries of 'collection0'
+        for usage in range(4):
+            registry.lookup("collection1", usage="usage%d" % usage)
+        self.assertIn(("collection0", "usage0", None), registry._cache)
+        shard = registry._cache.shard("collection0")
+        self.assertEqual(0, shard.evictions)
+        self.assertTrue(registry._cache.shard("collection1").evictions)
+        stats = registry._cache.stats()
+        self.assertEqual(
+            {"collection0", "collection1", "unknown"}, set(stats["shards"])
+        )
+
+    def test_lookup_deferred(self):
+        """Components of deferred addons are loaded when they are needed"""
+
+        class Speaker(AbstractComponent):
+            _name = "speaker"
+            _collection = "foobar"
+            _usage = "speaker"
+
+        class Foo(Component):
+            _name = "foo"
+            _inherit = "speaker"
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "foobar"
+            _usage = "listener"
+
+        class Foo2(Component):
+            _inherit = "foo"
+            _apply_on = ["res.partner"]
+
+        modules = MetaComponent._modules_components
+        modules["test_deferred_a"] = [Speaker, Foo]
+        modules["test_deferred_b"] = [Bar]
+        modules["test_deferred_c"] = [Foo2]
+        addons = ["test_deferred_a", "test_deferred_b", "test_deferred_c"]
+
+        registry = ComponentRegistry()
+        registry.load_components("component")
+        registry.defer_components(addons)
+        registry.ready = True
+        self.assertEqual({"component"}, registry._loaded_modules)
+
+        # 'bar' is complete without the next addon
+        self.assertEqual("listener", registry["bar"]._usage)
+        self.assertEqual(
+            {"component", "test_deferred_a", "test_deferred_b"},
+            registry._loaded_modules,
+        )
+        # 'foo' is extended by the last addon
+        components = registry.lookup("foobar", usage="speaker")
+        self.assertEqual(["foo"], [c._name for c in components])
+        self.assertEqual(["res.partner"], components[0]._apply_on)
+        self.assertIn("test_deferred_c", registry._loaded_modules)
+
+        # same components as loaded in order
+        eager_registry = ComponentRegistry()
+        eager_registry.load_components("component")
+        for addon in addons:
+            eager_registry.load_components(addon)
+        self.assertEqual(list(eager_registry), list(registry))
+        for name in eager_registry:
+            self.assertEqual(
+                [base.__name__ for base in eager_registry[name].__mro__],
+                [base.__name__ for base in registry[name].__mro__],
+            )
+
+    def test_lookup_deferred_frozen(self):
+        """Deferred components are loaded in a frozen registry"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "foobar"
+
+        MetaComponent._modules_components["test_deferred_a"] = [Foo]
+        registry = ComponentRegistry()
+        registry.load_components("component")
+        registry.defer_components(["test_deferred_a"])
+        registry.ready = True
+        registry.freeze()
+        components = registry.lookup("foobar")
+        self.assertEqual(["foo"], [c._name for c in components])
+        self.assertTrue(registry.frozen)
+        with self.assertRaises(TypeError):
+            registry._components["bar"] = Foo
+
+    def test_lookup_threads(self):
+        """Concurrent lookups on the same registry"""
+        registry = ComponentRegistry(cachesize=8)
+        registry.load_components("component")
+        for index in range(20):
+            component_class = type(
+                "Component%d" % index,
+                (Component,),
+                {
+                    "__module__": __name__,
+                    "_name": "component%d" % index,
+                    "_collection": "collection%d" % (index % 2),
+                    "_usage": "usage%d" % (index % 5),
+                    "_apply_on": ["res.partner"] if index % 3 else None,
+                },
+            )
+            component_class._build_component(registry)
+        registry.ready = True
+        keys = [
+            (collection_name, "usage%d" % usage, model_name)
+            for collection_name in ("collection0", "collection1", None)
+            for usage in range(5)
+            for model_name in ("res.partner", "res.users", None)
+        ]
+        expected = {key: list(registry.lookup(*key)) for key in keys}
+        errors = []
+
+        def lookups(offset):
+            try:
+                for iteration in range(300):
+                    key = keys[(offset + iteration * 7) % len(keys)]
+                    if list(registry.lookup(*key)) != expected[key]:
+                        errors.append(key)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [
+            threading.Thread(target=lookups, args=(offset,)) for offset in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        # every collection has its own shard of the cache
+        for shard in registry._cache.shards().values():
+            self.assertLessEqual(len(shard), 8)
+        self.assertTrue(registry._cache.evictions)
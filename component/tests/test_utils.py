@@ -3,7 +3,11 @@
 
 from unittest import mock
 
-from odoo.addons.component.utils import is_component_registry_ready
+from odoo.addons.component.utils import (
+    get_component_registry_cache_stats,
+    get_component_registry_memory_report,
+    is_component_registry_ready,
+)
 
 from .common import TransactionComponentRegistryCase
 
@@ -18,3 +22,39 @@ class TestUtils(TransactionComponentRegistryCase):
             mocked.return_value = self.comp_registry
             self.assertTrue(is_component_registry_ready(self.env.cr.dbname))
             self._teardown_registry(self)
+
+    def test_registry_cache_stats(self):
+        path = "odoo.addons.component.utils.get_component_registry"
+        with mock.patch(path) as mocked:
+            mocked.return_value = None
+            self.assertEqual({}, get_component_registry_cache_stats(self.env.cr.dbname))
+            self._setup_registry(self)
+            mocked.return_value = self.comp_registry
+            self.comp_registry.lookup(usage="foo")
+            self.comp_registry.lookup(usage="foo")
+            stats = get_component_registry_cache_stats(self.env.cr.dbname)
+            self.assertEqual(1, stats["lookup"]["hits"])
+            self.assertEqual(1, stats["lookup"]["misses"])
+            self.assertEqual(1, stats["lookup"]["currsize"])
+            self._teardown_registry(self)
+
+    def test_registry_memory_report(self):
+        path = "odoo.addons.component.utils.get_component_registry"
+        with mock.patch(path) as mocked:
+            mocked.return_value = None
+            self.assertEqual(
+                {}, get_component_registry_memory_report(self.env.cr.dbname)
+            )
+            self._setup_registry(self)
+            mocked.return_value = self.comp_registry
+            self.comp_registry.lookup(usage="foo")
+            report = get_component_registry_memory_report(self.env.cr.dbname)
+            self.assertEqual(len(list(self.comp_registry)), report["components"])
+            self.assertGreaterEqual(
+                report["live_component_classes"], report["components"]
+            )
+            self.assertEqual(1, report["lookup_cache_entries"])
+            self.comp_registry.release()
+            report = get_component_registry_memory_report(self.env.cr.dbname)
+            self.assertEqual(0, report["lookup_cache_entries"])
+            self._teardown_registry(self)
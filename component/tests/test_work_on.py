@@ -71,3 +71,21 @@ class TestWorkOn(TransactionComponentRegistryCase):
         self.assertIs(registry, work2.components_registry)
         # test_keyword has been propagated to the new WorkContext instance
         self.assertEqual("value", work2.test_keyword)
+
+    def test_work_on_memoized(self):
+        """The work contexts created by work_on are used again"""
+        registry = ComponentRegistry()
+        work = WorkContext(
+            model_name="res.partner",
+            collection=self.collection,
+            components_registry=registry,
+            test_keyword="value",
+        )
+        work2 = work.work_on("res.users")
+        self.assertIs(work2, work.work_on("res.users"))
+        self.assertIsNot(work2, work.work_on("res.partner"))
+        # the modified attributes are propagated
+        work.test_keyword = "other value"
+        work3 = work.work_on("res.users")
+        self.assertIsNot(work2, work3)
+        self.assertEqual("other value", work3.test_keyword)
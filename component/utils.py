@@ -12,3 +12,30 @@ def is_component_registry_ready(dbname):
     """Return True if the registry is ready to be used."""
     comp_registry = get_component_registry(dbname)
     return comp_registry.ready if comp_registry else False
+
+
+def get_component_registry_cache_stats(dbname):
+    """Return the statistics of the lookup caches of a database
+
+    See :meth:`~odoo.addons.component.core.ComponentRegistry.cache_stats`.
+    """
+    comp_registry = get_component_registry(dbname)
+    return comp_registry.cache_stats() if comp_registry else {}
+
+
+def get_component_registry_memory_report(dbname):
+    """Return the component classes and cache entries alive for a database
+
+    See :meth:`~odoo.addons.component.core.ComponentRegistry.memory_report`.
+    """
+    comp_registry = get_component_registry(dbname)
+    return comp_registry.memory_report() if comp_registry else {}
+
+
+def get_component_registry_build_profile(dbname):
+    """Return the time spent to build the components of a database
+
+    See :meth:`~odoo.addons.component.core.ComponentRegistry.build_profile`.
+    """
+    comp_registry = get_component_registry(dbname)
+    return comp_registry.build_profile() if comp_registry else {}
@@ -4,3 +4,5 @@ from . import models
 
 # allow public API 'from odoo.addons.component_event import skip_if'
 from .components.event import skip_if  # noqa
+from .components.event import deferred_event  # noqa
+from .components.event import watched_fields  # noqa
@@ -3,7 +3,7 @@
 
 {
     "name": "Components Events",
-    "version": "16.0.1.0.1",
+    "version": "16.0.2.0.0",
     "author": "Camptocamp," "Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/connector",
     "license": "LGPL-3",
@@ -103,31 +103,64 @@ will be executed::
 An event can be skipped based on a condition evaluated from the notified
 arguments. See :func:`skip_if`
 
+The events of a record can also be delivered once at the pre-commit of the
+cursor, with the fields written meanwhile. See :func:`deferred_event`
+
+A listener can be notified only when some fields are created or written.
+See :func:`watched_fields`
+
 
 """
 
 import logging
 import operator
-from collections import defaultdict
+import weakref
+from collections import OrderedDict, defaultdict
 from functools import wraps
 
 # pylint: disable=W7950
-from odoo.addons.component.core import AbstractComponent, Component
+from odoo.addons.component.core import AbstractComponent, Component, StatsLRUCache
 
 _logger = logging.getLogger(__name__)
 
 try:
-    from cachetools import LRUCache, cachedmethod
+    from cachetools import cachedmethod
+    from cachetools.keys import hashkey
 except ImportError:
     _logger.debug("Cannot import 'cachetools'.")
 
-__all__ = ["skip_if"]
+__all__ = ["skip_if", "deferred_event", "watched_fields"]
 
 # Number of items we keep in LRU cache when we collect the events.
 # 1 item means: for an event name, model_name, collection, return
 # the event methods
 DEFAULT_EVENT_CACHE_SIZE = 512
 
+# names of the events defined by the classes, see _class_events()
+_class_events_cache = weakref.WeakKeyDictionary()
+
+# events having listeners by index of the components registry, see
+# EventCollecter._listened_events()
+_listened_events_cache = weakref.WeakKeyDictionary()
+
+# key of the deferred events in the data of the pre-commit callbacks of the
+# cursor, see deferred_event()
+DEFERRED_EVENTS_KEY = "component_event.deferred_events"
+# key of the instances of the stateless listeners kept until the pre-commit
+# callbacks run, in the same data, see EventCollecter._listener()
+LISTENERS_KEY = "component_event.listeners"
+
+
+def _class_events(cls):
+    """Return the names of the events defined in a class itself"""
+    try:
+        return _class_events_cache[cls]
+    except KeyError:
+        pass
+    events = frozenset(name for name in vars(cls) if name.startswith("on_"))
+    _class_events_cache[cls] = events
+    return events
+
 
 def skip_if(cond):
     """Decorator allowing to skip an event based on a condition
@@ -164,6 +197,107 @@ def skip_if(cond):
     return skip_if_decorator
 
 
+def watched_fields(*fields):
+    """Decorator for the events of the listeners interested in some fields
+
+    When the events are collected for fields (such as ``on_record_create``
+    and ``on_record_write``, with the fields created or written), the
+    events of the listeners watching none of these fields are skipped,
+    without creating the listeners.
+
+    If ``watched_fields`` is not used, the event is always notified.
+
+    Usage::
+
+        @watched_fields('name', 'street')
+        def on_record_write(self, record, fields=None):
+            record.with_delay().export_record(fields=fields)
+
+    :param ``*fields``: names of the fields which trigger the event
+
+    """
+
+    def watched_fields_decorator(func):
+        func.watched_fields = frozenset(fields)
+        return func
+
+    return watched_fields_decorator
+
+
+def deferred_event(func):
+    """Decorator delivering the events of a record at the pre-commit of the cursor
+
+    The event must take a record as first argument and optionally the
+    ``fields`` keyword argument, as ``on_record_create`` and
+    ``on_record_write``. When it is notified, the event is kept until the
+    pre-commit hooks of the cursor, where it is called once by listener and
+    record, with the fields of all the notifications (``None`` if one of them
+    had no fields). Every record is delivered separately, and the records
+    deleted meanwhile are not delivered.
+
+    The pre-commit hooks are run when the cursor is flushed: at the commit
+    of the transaction, but also when a savepoint is created or released,
+    so the events are delivered once between two savepoints, not once for
+    the transaction. The events kept in a savepoint rolled back are
+    dropped.
+
+    Example::
+
+        @deferred_event
+        def on_record_write(self, record, fields=None):
+            # only once per record, even if it is written several times
+            record.with_delay().export_record(fields=fields)
+
+    Used with :func:`skip_if`, the condition is evaluated when the event is
+    notified if :func:`skip_if` is applied first, and when the event is
+    delivered otherwise.
+
+    """
+
+    @wraps(func)
+    def deferred_wrapper(self, records, fields=None):
+        precommit = records.env.cr.precommit
+        events = precommit.data.get(DEFERRED_EVENTS_KEY)
+        if events is None:
+            events = precommit.data[DEFERRED_EVENTS_KEY] = OrderedDict()
+            precommit.add(lambda: _deliver_deferred_events(events))
+        for record in records:
+            key = (type(self), func.__name__, record._name, record.id)
+            event = events.get(key)
+            if event is None:
+                events[key] = [
+                    func,
+                    self,
+                    record,
+                    set(fields) if fields is not None else None,
+                ]
+            elif event[3] is not None:
+                if fields is None:
+                    event[3] = None
+                else:
+                    event[3].update(fields)
+
+    return deferred_wrapper
+
+
+def _deliver_deferred_events(events):
+    """Call the events kept by :func:`deferred_event`
+
+    The events notified by the deferred events themselves are delivered
+    too, except for the listeners and records already delivered, so a
+    listener modifying its record is not called again.
+    """
+    delivered = set()
+    while events:
+        key, (func, listener, record, fields) = events.popitem(last=False)
+        if key in delivered or not record.exists():
+            continue
+        delivered.add(key)
+        if fields is not None:
+            fields = sorted(fields)
+        func(listener, record, fields=fields)
+
+
 class CollectedEvents:
     """Event methods ready to be notified
 
@@ -191,6 +325,10 @@ class CollectedEvents:
             event(*args, **kwargs)
 
 
+# returned for the events without listeners
+NO_EVENTS = CollectedEvents(())
+
+
 class EventCollecter(Component):
     """Component that collects the event from an event name
 
@@ -201,8 +339,17 @@ class EventCollecter(Component):
     Then it feeds the events to an instance of :class:`EventCollecter`
     and return it to the caller.
 
-    It keeps the results in a cache, the Component is rebuilt when
+    The listeners of an event are found once for a collection and a model:
+    the result is a dispatch plan, the tuple of the listener classes in the
+    order of the registry with the fields they watch (see
+    :func:`watched_fields`), kept in a cache. The Component is rebuilt when
     the Odoo's registry is rebuilt, hence the cache is cleared as well.
+    A collecter creates only one instance of every listener, used for all
+    the events it collects. The instances of the listeners keeping no state
+    (``_stateless = True``) are kept until the pre-commit callbacks of the
+    cursor run (at commit and at the creation or release of a savepoint),
+    and used by the collecters of the same environment, model and
+    collection.
 
     An event always starts with ``on_``.
 
@@ -217,6 +364,15 @@ class EventCollecter(Component):
 
     _name = "base.event.collecter"
 
+    #: size the cache from the events collected during a warm-up, instead
+    #: of using ``DEFAULT_EVENT_CACHE_SIZE``
+    _cache_autosize = False
+
+    def __init__(self, work_context):
+        super(EventCollecter, self).__init__(work_context)
+        # instances of the listeners, by class
+        self._listeners = {}
+
     @classmethod
     def _complete_component_build(cls):
         """Create a cache on the class when the component is built"""
@@ -225,7 +381,9 @@ class EventCollecter(Component):
         # dynamically rebuild when odoo registry is rebuild, we
         # are sure that the result is always the same for a lookup
         # until the next rebuild of odoo's registry
-        cls._cache = LRUCache(maxsize=DEFAULT_EVENT_CACHE_SIZE)
+        cls._cache = StatsLRUCache(
+            maxsize=DEFAULT_EVENT_CACHE_SIZE, autosize=cls._cache_autosize
+        )
         return
 
     def _collect_events(self, name):
@@ -236,32 +394,158 @@ class EventCollecter(Component):
 
     @cachedmethod(operator.attrgetter("_cache"))
     def _collect_events_cached(self, collection_name, model_name, name):
-        events = defaultdict(set)
-        component_classes = self.work.components_registry.lookup(
+        return self._find_events(
+            self.work.components_registry, collection_name, model_name, name
+        )
+
+    @classmethod
+    def _find_events(cls, registry, collection_name, model_name, name):
+        """Return the dispatch plan of an event
+
+        The listener classes having the event, with the fields watched by
+        the event or ``None``.
+        """
+        component_classes = registry.lookup(
             collection_name=collection_name,
             usage="event.listener",
             model_name=model_name,
         )
-        for cls in component_classes:
-            if cls.has_event(name):
-                events[cls].add(name)
-        return events
+        return tuple(
+            (
+                component_class,
+                getattr(getattr(component_class, name), "watched_fields", None),
+            )
+            for component_class in component_classes
+            if component_class.has_event(name)
+        )
 
-    def _init_collected_events(self, class_events):
-        events = set()
-        for cls, names in class_events.items():
-            for name in names:
-                component = cls(self.work)
-                events.add(getattr(component, name))
-        return events
-
-    def collect_events(self, name):
-        """Collect the events of a given name"""
+    @classmethod
+    def _listened_events(cls, registry):
+        """Return the names of the events having listeners, by model
+
+        It is a tuple with a dict of the events by model, and the events of
+        the listeners applied on any model, included in the events of every
+        model. It is computed once for the components of a registry, when
+        the registry is ready (see :meth:`_component_registry_ready`).
+        """
+        listened = _listened_events_cache.get(registry.index)
+        if listened is not None:
+            return listened
+        # load the listeners of the deferred addons before using the index
+        registry.lookup(usage="event.listener")
+        index = registry.index
+        by_model = defaultdict(set)
+        any_model = set()
+        # not the cached lookup, which is not cleared when components are
+        # added to the registry
+        for listener in index.lookup(usage="event.listener"):
+            if listener.apply_on_models is None:
+                any_model.update(listener._events)
+            else:
+                for model_name in listener.apply_on_models:
+                    by_model[model_name].update(listener._events)
+        any_model = frozenset(any_model)
+        listened = (
+            {
+                model_name: frozenset(events | any_model)
+                for model_name, events in by_model.items()
+            },
+            any_model,
+        )
+        _listened_events_cache[index] = listened
+        return listened
+
+    @classmethod
+    def _component_registry_ready(cls, registry):
+        """Find the events having listeners before the first event"""
+        super(EventCollecter, cls)._component_registry_ready(registry)
+        cls._listened_events(registry)
+
+    @classmethod
+    def has_listeners(cls, registry, model_name, name):
+        """Indicate if an event of a model may have listeners
+
+        The listeners of every collection are considered, so when it
+        returns ``False``, the event can be skipped without collecting it.
+        """
+        by_model, any_model = cls._listened_events(registry)
+        return name in by_model.get(model_name, any_model)
+
+    @classmethod
+    def _prewarm_component_cache(cls, registry):
+        """Collect the events of the models and collections of the listeners"""
+        super(EventCollecter, cls)._prewarm_component_cache(registry)
+        cls._listened_events(registry)
+        listeners = registry.lookup(usage="event.listener")
+        collection_names = [None]
+        model_names = set()
+        event_names = set()
+        for listener in listeners:
+            if listener._collection not in collection_names:
+                collection_names.append(listener._collection)
+            model_names.update(listener.apply_on_models or ())
+            event_names.update(listener._events)
+        for collection_name in collection_names:
+            for model_name in sorted(model_names):
+                for name in sorted(event_names):
+                    cache = cls._cache
+                    if cache.maxsize is not None and len(cache) >= cache.maxsize:
+                        return
+                    # same key as the one used by cachedmethod
+                    key = hashkey(collection_name, model_name, name)
+                    if key not in cache:
+                        cache[key] = cls._find_events(
+                            registry, collection_name, model_name, name
+                        )
+
+    def _listener(self, cls):
+        listener = self._listeners.get(cls)
+        if listener is None:
+            if cls._stateless:
+                listener = self._transaction_listener(cls)
+            else:
+                listener = cls(self.work)
+            self._listeners[cls] = listener
+        return listener
+
+    def _transaction_listener(self, cls):
+        """Return the shared instance of a stateless listener
+
+        The instances are kept in the data of the pre-commit callbacks of
+        the cursor, cleared when they run: at commit and at the creation or
+        release of a savepoint.
+        """
+        work = self.work
+        env = work.env
+        listeners = env.cr.precommit.data.setdefault(LISTENERS_KEY, {})
+        key = (cls, env, work.model_name, work._collection, work.components_registry)
+        listener = listeners.get(key)
+        if listener is None:
+            listener = listeners[key] = cls(work)
+        return listener
+
+    def _init_collected_events(self, name, plan):
+        return tuple(getattr(self._listener(cls), name) for cls, __ in plan)
+
+    def collect_events(self, name, fields=None):
+        """Collect the events of a given name
+
+        When ``fields`` is given, the events watching other fields are
+        skipped (see :func:`watched_fields`).
+        """
         if not name.startswith("on_"):
             raise ValueError("an event name always starts with 'on_'")
 
-        events = self._init_collected_events(self._collect_events(name))
-        return CollectedEvents(events)
+        plan = self._collect_events(name)
+        if fields is not None:
+            plan = [
+                (cls, watched)
+                for cls, watched in plan
+                if watched is None or not watched.isdisjoint(fields)
+            ]
+        if not plan:
+            return NO_EVENTS
+        return CollectedEvents(self._init_collected_events(name, plan))
 
 
 class EventListener(AbstractComponent):
@@ -286,9 +570,9 @@ class EventListener(AbstractComponent):
         """Make a list of events listeners for this class"""
         events = set()
         if not cls._abstract:
-            for attr_name in dir(cls):
-                if attr_name.startswith("on_"):
-                    events.add(attr_name)
+            # same names as in dir(cls), without listing all the attributes
+            for klass in cls.__mro__:
+                events.update(_class_events(klass))
         cls._events = events
 
     @classmethod
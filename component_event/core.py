@@ -36,6 +36,8 @@ class EventWorkContext(WorkContext):
 
     """
 
+    __slots__ = ("_env", "_collection")
+
     def __init__(
         self,
         model_name=None,
@@ -102,6 +104,11 @@ class EventWorkContext(WorkContext):
                     "the Odoo env of the collection must be "
                     "the same than the current one"
                 )
+        return super(EventWorkContext, self).work_on(
+            model_name=model_name, collection=collection
+        )
+
+    def _new_work_context(self, model_name=None, collection=None):
         kwargs = {
             attr_name: getattr(self, attr_name) for attr_name in self._propagate_kwargs
         }
@@ -14,7 +14,7 @@ from odoo import api, models
 
 from odoo.addons.component.core import _component_databases
 
-from ..components.event import CollectedEvents
+from ..components.event import NO_EVENTS
 from ..core import EventWorkContext
 
 
@@ -31,12 +31,26 @@ class Base(models.AbstractModel):
     * ``on_record_unlink(self, record)``
 
     ``on_record_unlink`` is notified just *before* the unlink is done.
+    The listeners of ``on_record_create`` and ``on_record_write`` can be
+    restricted to some fields with
+    :func:`~odoo.addons.component_event.components.event.watched_fields`.
+
+    The same events are notified once for all the records of a call, after
+    the events of every record:
+
+    * ``on_records_create(self, records, fields=None)``, the fields are
+      the ones of every created record
+    * ``on_records_write(self, records, fields=None)``
+    * ``on_records_unlink(self, records)``
+
+    A listener doing the same thing for every record, such as delaying a
+    job, should rather implement them.
 
     """
 
     _inherit = "base"
 
-    def _event(self, name, collection=None, components_registry=None):
+    def _event(self, name, collection=None, components_registry=None, fields=None):
         """Collect events for notifications
 
         Usage::
@@ -59,6 +73,9 @@ class Base(models.AbstractModel):
                                     mainly used for tests
         :type components_registry:
             :class:`odoo.addons.components.core.ComponentRegistry`
+        :param fields: optional fields concerned by the event, the
+                       listeners watching other fields are not notified
+                       (see :func:`..components.event.watched_fields`)
 
 
         """
@@ -76,11 +93,17 @@ class Base(models.AbstractModel):
             # to be ready, and anyway we should probably not trigger events
             # during the initialization. Hence we return an empty list of
             # events, the 'notify' calls will do nothing.
-            return CollectedEvents([])
-        if not comp_registry.get("base.event.collecter"):
-            return CollectedEvents([])
-
+            return NO_EVENTS
+        collecter_class = comp_registry.get("base.event.collecter")
+        if not collecter_class:
+            return NO_EVENTS
         model_name = self._name
+        if name.startswith("on_") and not collecter_class.has_listeners(
+            comp_registry, model_name, name
+        ):
+            # most of the models have no listeners, nothing to collect
+            return NO_EVENTS
+
         if collection is not None:
             work = EventWorkContext(
                 collection=collection,
@@ -94,26 +117,48 @@ class Base(models.AbstractModel):
                 components_registry=components_registry,
             )
 
-        collecter = work._component_class_by_name("base.event.collecter")(work)
-        return collecter.collect_events(name)
+        collecter = collecter_class(work)
+        return collecter.collect_events(name, fields=fields)
 
     @api.model_create_multi
     def create(self, vals_list):
         records = super(Base, self).create(vals_list)
+        all_fields = {}
+        for vals in vals_list:
+            all_fields.update(dict.fromkeys(vals))
+        all_fields = list(all_fields)
+        # the events are collected once for the records with the same fields
+        events_by_fields = {}
         for idx, vals in enumerate(vals_list):
             fields = list(vals.keys())
-            self._event("on_record_create").notify(records[idx], fields=fields)
+            key = frozenset(fields)
+            events = events_by_fields.get(key)
+            if events is None:
+                events = events_by_fields[key] = self._event(
+                    "on_record_create", fields=fields
+                )
+            events.notify(records[idx], fields=fields)
+        if records:
+            self._event("on_records_create", fields=all_fields).notify(
+                records, fields=all_fields
+            )
         return records
 
     def write(self, vals):
         result = super(Base, self).write(vals)
         fields = list(vals.keys())
+        events = self._event("on_record_write", fields=fields)
         for record in self:
-            self._event("on_record_write").notify(record, fields=fields)
+            events.notify(record, fields=fields)
+        if self:
+            self._event("on_records_write", fields=fields).notify(self, fields=fields)
         return result
 
     def unlink(self):
+        events = self._event("on_record_unlink")
         for record in self:
-            self._event("on_record_unlink").notify(record)
+            events.notify(record)
+        if self:
+            self._event("on_records_unlink").notify(self)
         result = super(Base, self).unlink()
         return result
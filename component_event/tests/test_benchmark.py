@@ -0,0 +1,111 @@
+# Copyright 2026 Odoo Community Association (OCA)
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+"""Benchmark of the dispatch of the events to the listeners
+
+It is not run with the standard tests, run it with::
+
+    odoo -d db -i component_event --test-tags component_event_benchmark \
+        --stop-after-init
+
+The results are appended to the same file as the benchmark of the
+components registry, see :mod:`odoo.addons.component.tests.test_benchmark`.
+"""
+
+import logging
+
+from odoo.tests.common import tagged
+
+from odoo.addons.component.core import Component
+from odoo.addons.component.tests.common import TransactionComponentRegistryCase
+from odoo.addons.component.tests.test_benchmark import (
+    time_calls,
+    write_benchmark_results,
+)
+
+from ..components.event import NO_EVENTS
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged("-standard", "component_event_benchmark")
+class TestEventBenchmark(TransactionComponentRegistryCase):
+    """Measure the notification of events to a number of listeners"""
+
+    #: number of listeners of the benchmarked event
+    sizes = [0, 1, 10, 50]
+    #: number of records the event is notified for
+    records = 100
+
+    def setUp(self):
+        super().setUp()
+        self._setup_registry(self)
+        self._load_module_components("component_event")
+
+    def tearDown(self):
+        self._teardown_registry(self)
+        super().tearDown()
+
+    def _build_listeners(self, registry, listeners):
+        def on_record_write(self, record, fields=None):
+            pass
+
+        for index in range(listeners):
+            name = "bench.event.listener.%d" % index
+            listener_class = type(
+                name,
+                (Component,),
+                {
+                    "__module__": __name__,
+                    "_name": name,
+                    "_inherit": "base.event.listener",
+                    "_apply_on": ["res.partner"],
+                    "on_record_write": on_record_write,
+                },
+            )
+            listener_class._build_component(registry)
+
+    def _benchmark_dispatch(self, listeners):
+        # the listeners are added to a copy, with an empty cache of events
+        registry = self.comp_registry.clone()
+        self._build_listeners(registry, listeners)
+        registry.ready = True
+        partners = (
+            self.env["res.partner"]
+            .with_context(components_registry=registry)
+            .create([{"name": "benchmark %d" % index} for index in range(self.records)])
+        )
+        records = list(partners)
+
+        event = time_calls(lambda record: record._event("on_record_write"), records[:1])
+        warm_event = time_calls(
+            lambda record: record._event("on_record_write"), records
+        )
+        events = partners._event("on_record_write")
+        self.assertEqual(listeners, len(events.events))
+        if not listeners:
+            self.assertIs(NO_EVENTS, events)
+        notify = time_calls(
+            lambda record: events.notify(record, fields=["name"]), records
+        )
+        # the events are collected once for all the records written
+        write = time_calls(
+            lambda records: records.write({"name": "benchmark"}), [partners]
+        )
+        return {
+            "benchmark": "event_dispatch",
+            "listeners": listeners,
+            "records": self.records,
+            "cold_event_us": event,
+            "event_us": warm_event,
+            "notify_us": notify,
+            "write_us": write / self.records,
+        }
+
+    def test_benchmark(self):
+        results = []
+        for listeners in self.sizes:
+            result = self._benchmark_dispatch(listeners)
+            _logger.info("Event benchmark: %s", result)
+            results.append(result)
+        write_benchmark_results(self.env, "component_event", results)
@@ -4,6 +4,8 @@
 import unittest
 from unittest import mock
 
+from cachetools.keys import hashkey
+
 from odoo.tests.common import MetaCase, tagged
 
 from odoo.addons.component.core import Component
@@ -11,7 +13,13 @@ from odoo.addons.component.tests.common import (
     ComponentRegistryCase,
     TransactionComponentRegistryCase,
 )
-from odoo.addons.component_event.components.event import skip_if
+from odoo.addons.component_event.components.event import (
+    NO_EVENTS,
+    _listened_events_cache,
+    deferred_event,
+    skip_if,
+    watched_fields,
+)
 from odoo.addons.component_event.core import EventWorkContext
 
 
@@ -91,6 +99,9 @@ class TestEventWorkContext(unittest.TestCase, MetaCase("DummyCase", (), {})):
         self.assertEqual(env, work2.env)
         self.assertEqual("res.partner", work2.model_name)
         self.assertEqual(self.components_registry, work2.components_registry)
+        self.assertIs(
+            work2, work.work_on(model_name="res.partner", collection=collection)
+        )
         with self.assertRaises(ValueError):
             # pylint: disable=W0104
             work.collection  # noqa
@@ -339,6 +350,94 @@ class TestEvent(ComponentRegistryCase):
         # cache entry
         self.assertEqual(2, len(collected.events))
 
+    def test_event_dispatch_plan(self):
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+
+            def on_record_create(self):
+                pass
+
+            def on_record_write(self):
+                pass
+
+        class MyOtherEventListener(Component):
+            _name = "my.other.event.listener"
+            _inherit = "base.event.listener"
+
+            def on_record_create(self):
+                pass
+
+        self._build_components(MyEventListener, MyOtherEventListener)
+
+        collected = self.collecter.collect_events("on_record_create")
+        # the listeners are notified in the order of the registry
+        self.assertEqual(
+            ["my.event.listener", "my.other.event.listener"],
+            [event.__self__._name for event in collected.events],
+        )
+        plan = self.collecter._cache[hashkey(None, "res.users", "on_record_create")]
+        self.assertEqual(
+            (
+                (self.comp_registry["my.event.listener"], None),
+                (self.comp_registry["my.other.event.listener"], None),
+            ),
+            plan,
+        )
+        # the collecter creates one instance of every listener
+        event = self.collecter.collect_events("on_record_write").events[0]
+        self.assertIs(collected.events[0].__self__, event.__self__)
+
+    def test_watched_fields(self):
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+
+            @watched_fields("name", "street")
+            def on_record_write(self, record, fields=None):
+                pass
+
+        class MyOtherEventListener(Component):
+            _name = "my.other.event.listener"
+            _inherit = "base.event.listener"
+
+            @skip_if(lambda self, record, fields=None: False)
+            @watched_fields("ref")
+            def on_record_write(self, record, fields=None):
+                pass
+
+        self._build_components(MyEventListener, MyOtherEventListener)
+
+        def listeners(fields):
+            collected = self.collecter.collect_events("on_record_write", fields=fields)
+            return [event.__self__._name for event in collected.events]
+
+        self.assertEqual(["my.event.listener"], listeners(["name", "email"]))
+        self.assertEqual(["my.other.event.listener"], listeners(["ref"]))
+        self.assertEqual([], listeners(["email"]))
+        self.assertEqual(
+            ["my.event.listener", "my.other.event.listener"], listeners(None)
+        )
+
+    def test_prewarm(self):
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.users"]
+
+            def on_record_create(self):
+                pass
+
+        MyEventListener._build_component(self.comp_registry)
+        self.comp_registry.prewarm()
+
+        cache = self.collecter._cache
+        self.assertIn(hashkey(None, "res.users", "on_record_create"), cache)
+        hits = cache.hits
+        collected = self.collecter.collect_events("on_record_create")
+        self.assertEqual(1, len(collected.events))
+        self.assertEqual(hits + 1, cache.hits)
+
     def test_skip_if(self):
         class MyEventListener(Component):
             _name = "my.event.listener"
@@ -424,6 +523,265 @@ class TestEventFromModel(TransactionComponentRegistryCase):
         self.assertEqual("bar", partner.name)
         self.assertEqual("bar", partner.ref)
 
+    def test_event_records(self):
+        """The events of the records of a call are notified once"""
+        calls = []
+
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.partner"]
+
+            def on_records_create(self, records, fields=None):
+                calls.append(("create", records, set(fields)))
+
+            def on_records_write(self, records, fields=None):
+                calls.append(("write", records, set(fields)))
+
+            def on_records_unlink(self, records):
+                calls.append(("unlink", records, None))
+
+            def on_record_write(self, record, fields=None):
+                calls.append(("write_one", record, set(fields)))
+
+        self._build_components(MyEventListener)
+
+        partner_model = self.env["res.partner"].with_context(
+            components_registry=self.comp_registry
+        )
+        partners = partner_model.create(
+            [{"name": "test"}, {"name": "test2", "ref": "T2"}]
+        )
+        self.assertIn(("create", partners, {"name", "ref"}), calls)
+        del calls[:]
+        partners.write({"ref": "T"})
+        self.assertEqual(
+            [
+                ("write_one", partners[0], {"ref"}),
+                ("write_one", partners[1], {"ref"}),
+                ("write", partners, {"ref"}),
+            ],
+            [call for call in calls if call[2] == {"ref"}],
+        )
+        del calls[:]
+        partners.unlink()
+        self.assertIn(("unlink", partners, None), calls)
+
+    def test_deferred_event(self):
+        """The deferred events are delivered once per record at commit"""
+        calls = []
+
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.partner"]
+
+            @deferred_event
+            def on_record_write(self, record, fields=None):
+                calls.append((record, set(fields)))
+                # not delivered again
+                record.write({"function": "exported"})
+
+        self._build_components(MyEventListener)
+
+        partners = (
+            self.env["res.partner"]
+            .with_context(components_registry=self.comp_registry)
+            .create([{"name": "test"}, {"name": "test2"}])
+        )
+        partners.write({"name": "test3"})
+        partners[0].write({"ref": "T"})
+        partners[1].unlink()
+        self.assertEqual([], calls)
+        self.env.cr.precommit.run()
+        self.assertEqual(1, len(calls))
+        record, fields = calls[0]
+        self.assertEqual(partners[0], record)
+        self.assertLessEqual({"name", "ref"}, fields)
+        self.assertEqual("exported", partners[0].function)
+
+    def test_deferred_event_savepoint(self):
+        """The deferred events are delivered when a savepoint is created"""
+        calls = []
+
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.partner"]
+
+            @deferred_event
+            def on_record_write(self, record, fields=None):
+                calls.append(set(fields))
+
+        self._build_components(MyEventListener)
+
+        partner = (
+            self.env["res.partner"]
+            .with_context(components_registry=self.comp_registry)
+            .create({"name": "test"})
+        )
+        partner.write({"name": "test2"})
+        with self.env.cr.savepoint():
+            # the cursor is flushed when the savepoint is created
+            self.assertEqual(1, len(calls))
+            self.assertIn("name", calls[0])
+            partner.write({"ref": "T"})
+        partner.write({"function": "test"})
+        self.env.cr.precommit.run()
+        fields = set().union(*calls[1:])
+        self.assertLessEqual({"ref", "function"}, fields)
+        self.assertNotIn("name", fields)
+
+        # the events of a savepoint rolled back are dropped
+        calls.clear()
+        with self.assertRaises(ValueError):
+            with self.env.cr.savepoint():
+                partner.write({"ref": "T2"})
+                raise ValueError()
+        self.env.cr.precommit.run()
+        self.assertEqual([], calls)
+
+    def test_event_watched_fields(self):
+        """Only the listeners watching the written fields are notified"""
+        calls = []
+
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.partner"]
+
+            @watched_fields("ref")
+            def on_record_write(self, record, fields=None):
+                calls.append(fields)
+
+        self._build_components(MyEventListener)
+
+        partner = (
+            self.env["res.partner"]
+            .with_context(components_registry=self.comp_registry)
+            .create({"name": "test"})
+        )
+        partner.write({"name": "test2"})
+        self.assertEqual([], calls)
+        partner.write({"name": "test3", "ref": "T"})
+        self.assertEqual([["name", "ref"]], calls)
+
+    def test_event_watched_fields_create(self):
+        """Only the records created with the watched fields are notified"""
+        calls = []
+
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.partner"]
+
+            @watched_fields("ref")
+            def on_record_create(self, record, fields=None):
+                calls.append((record, fields))
+
+        self._build_components(MyEventListener)
+
+        partners = (
+            self.env["res.partner"]
+            .with_context(components_registry=self.comp_registry)
+            .create([{"name": "test"}, {"name": "test2", "ref": "T"}])
+        )
+        self.assertEqual([(partners[1], ["name", "ref"])], calls)
+
+    def test_event_stateless_listener(self):
+        """The stateless listeners are kept for the transaction"""
+        listeners = []
+
+        class MyEventListener(Component):
+            _name = "my.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.partner"]
+            _stateless = True
+
+            def on_record_write(self, record, fields=None):
+                listeners.append(self)
+
+        class MyOtherEventListener(Component):
+            _name = "my.other.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.partner"]
+
+            def on_record_write(self, record, fields=None):
+                listeners.append(self)
+
+        self._build_components(MyEventListener, MyOtherEventListener)
+
+        partner = (
+            self.env["res.partner"]
+            .with_context(components_registry=self.comp_registry)
+            .create({"name": "test"})
+        )
+        partner.write({"name": "test2"})
+        partner.write({"name": "test3"})
+        self.assertEqual(4, len(listeners))
+        stateless, other, stateless2, other2 = listeners
+        self.assertIs(stateless, stateless2)
+        self.assertIsNot(other, other2)
+        # the instances are released when the pre-commit callbacks run
+        self.env.cr.precommit.run()
+        partner.write({"name": "test4"})
+        self.assertIsNot(stateless, listeners[4])
+
+    def test_event_no_listener(self):
+        """Nothing is collected for the events without listeners"""
+
+        class UserListener(Component):
+            _name = "user.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.users"]
+
+            def on_foo(self, record, name):
+                record.name = name
+
+        self._build_components(UserListener)
+
+        partner = self.env["res.partner"].create({"name": "test"})
+        registry = self.comp_registry
+        self.assertIs(NO_EVENTS, partner._event("on_foo", components_registry=registry))
+        self.assertIs(NO_EVENTS, partner._event("on_bar", components_registry=registry))
+        users = self.env["res.users"]
+        self.assertIsNot(
+            NO_EVENTS, users._event("on_foo", components_registry=registry)
+        )
+
+        class GlobalListener(Component):
+            _name = "global.event.listener"
+            _inherit = "base.event.listener"
+
+            def on_foo(self, record, name):
+                record.name = name
+
+        # the events are computed again for the new components
+        self._build_components(GlobalListener)
+        events = partner._event("on_foo", components_registry=registry)
+        self.assertIsNot(NO_EVENTS, events)
+        events.notify(partner, "bar")
+        self.assertEqual("bar", partner.name)
+
+    def test_event_listened_ready(self):
+        """The events having listeners are found when the registry is ready"""
+
+        class UserListener(Component):
+            _name = "user.event.listener"
+            _inherit = "base.event.listener"
+            _apply_on = ["res.users"]
+
+            def on_foo(self, record, name):
+                record.name = name
+
+        self._build_components(UserListener)
+        registry = self.comp_registry
+        self.assertNotIn(registry.index, _listened_events_cache)
+        registry.freeze()
+        by_model, any_model = _listened_events_cache[registry.index]
+        self.assertEqual({"on_foo"}, by_model["res.users"])
+        self.assertFalse(any_model)
+
     def test_event_filter_on_collection(self):
         class GlobalListener(Component):
             _name = "global.event.listener"
@@ -21,6 +21,10 @@ class BackendAdapter(AbstractComponent):
     _name = "base.backend.adapter"
     _inherit = "base.connector"
     _usage = "backend.adapter"
+    _log_slow_calls = True
+    # only the calls to the backend, not the inherited helpers such as
+    # component() which would log the slow calls of other components again
+    _slow_call_methods = ("search", "read", "search_read", "create", "write", "delete")
 
 
 # pylint: disable=W8106
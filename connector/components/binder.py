@@ -26,6 +26,10 @@ class Binder(AbstractComponent):
     This implementation assumes that binding models are ``_inherits`` of
     the models they are binding.
 
+    A binder keeping no state on its instances, like this one, can set
+    ``_stateless = True``, so the same instance is used by all the callers
+    of a work context.
+
     """
 
     _name = "base.binder"
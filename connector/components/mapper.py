@@ -12,6 +12,8 @@ external records into Odoo records and conversely.
 """
 
 import logging
+import time
+import weakref
 from collections import namedtuple
 from contextlib import contextmanager
 
@@ -292,6 +294,36 @@ def follow_m2o_relations(field):
 
 MappingDefinition = namedtuple("MappingDefinition", ["changed_by", "only_create"])
 
+# mapping methods of the classes of the addons, see _class_mappings()
+_class_mappings_cache = weakref.WeakKeyDictionary()
+
+
+def _class_mappings(cls):
+    """Return the mapping methods of a "real" class applied on mappers
+
+    As a list of ``(attr_name, changed_by, only_create)``. The classes of
+    the addons do not change, so they are inspected only once, not at
+    every build of the mappers.
+    """
+    try:
+        return _class_mappings_cache[cls]
+    except KeyError:
+        pass
+    mappings = []
+    for attr_name in dir(cls):
+        attr = getattr(cls, attr_name, None)
+        if not getattr(attr, "is_mapping", None):
+            continue
+        mappings.append(
+            (
+                attr_name,
+                frozenset(getattr(attr, "changed_by", ())),
+                getattr(attr, "only_create", False),
+            )
+        )
+    _class_mappings_cache[cls] = mappings
+    return mappings
+
 
 class MapChild(AbstractComponent):
     """MapChild is responsible to convert items.
@@ -562,6 +594,9 @@ class Mapper(AbstractComponent):
     _name = "base.mapper"
     _inherit = "base.connector"
     _usage = "mapper"
+    # the slow calls of MapRecord.values are logged
+    _log_slow_calls = True
+    _slow_call_methods = ()
 
     direct = []  # direct conversion of a field to another (from_attr, to_attr)
     children = []  # conversion of sub-records (from_attr, to_attr, model)
@@ -624,12 +659,8 @@ class Mapper(AbstractComponent):
             else:
                 # this is a real class that needs to be applied upon
                 # the base Components
-                for attr_name in dir(base):
-                    attr = getattr(base, attr_name, None)
-                    if not getattr(attr, "is_mapping", None):
-                        continue
-                    has_only_create = getattr(attr, "only_create", False)
-                    mapping_changed_by = set(getattr(attr, "changed_by", ()))
+                for attr_name, changed_by, has_only_create in _class_mappings(base):
+                    mapping_changed_by = set(changed_by)
 
                     # if already existing, it has been defined in an previous
                     # base, extend the @changed_by set
@@ -950,6 +981,9 @@ class MapRecord:
 
     """
 
+    # created for every record and item mapped, keep them small
+    __slots__ = ("_source", "_mapper", "_parent", "_forced_values", "__weakref__")
+
     def __init__(self, mapper, source, parent=None):
         self._source = source
         self._mapper = mapper
@@ -1011,9 +1045,18 @@ class MapRecord:
                              mapping methods
 
         """
+        mapper = self._mapper
+        # slow mappings are logged, see AbstractComponent._log_slow_calls
+        threshold = mapper._slow_call_threshold
+        if threshold is not None:
+            start = time.perf_counter()
         options = MapOptions(for_create=for_create, fields=fields, **kwargs)
-        values = self._mapper._apply(self, options=options)
+        values = mapper._apply(self, options=options)
         values.update(self._forced_values)
+        if threshold is not None:
+            elapsed = time.perf_counter() - start
+            if elapsed >= threshold:
+                mapper._log_slow_call("values", elapsed)
         return values
 
     def update(self, *args, **kwargs):
@@ -1041,14 +1084,11 @@ class MapOptions(dict):
 
     """
 
-    def __getitem__(self, key):
-        try:
-            return super(MapOptions, self).__getitem__(key)
-        except KeyError:
-            return None
+    __slots__ = ()
 
-    def __getattr__(self, key):
-        return self[key]
+    def __missing__(self, key):
+        return None
 
-    def __setattr__(self, key, value):
-        self[key] = value
+    # no KeyError raised and caught when an option does not exist
+    __getattr__ = dict.get
+    __setattr__ = dict.__setitem__
@@ -35,6 +35,8 @@ class Synchronizer(AbstractComponent):
 
     _name = "base.synchronizer"
     _inherit = "base.connector"
+    _log_slow_calls = True
+    _slow_call_methods = ("run",)
 
     #: usage of the component used as mapper, can be customized in sub-classes
     _base_mapper_usage = "mapper"
@@ -614,6 +614,8 @@ class TestMapper(TransactionComponentRegistryCase):
         self.assertEqual(options.l, 2)
         self.assertEqual(options["undefined"], None)
         self.assertEqual(options.undefined, None)
+        # the attributes are stored as options
+        self.assertEqual({"xyz": "abc", "k": 1, "l": 2}, dict(options))
 
     def test_changed_by_fields(self):
         """Test attribute ``_changed_by_fields`` on Mapper."""
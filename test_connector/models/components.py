@@ -8,12 +8,14 @@ class ConnectorTestBinder(Component):
     _name = "connector.test.binder"
     _inherit = ["base.binder"]
     _apply_on = ["connector.test.binding"]
+    _stateless = True
 
 
 class NoInheritsBinder(Component):
     _name = "connector.test.no.inherits.binder"
     _inherit = ["base.binder"]
     _apply_on = ["no.inherits.binding"]
+    _stateless = True
 
     def unwrap_binding(self, binding):
         raise ValueError("Not an inherits")
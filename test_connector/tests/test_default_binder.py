@@ -42,3 +42,11 @@ class TestDefaultBinder(TransactionComponentCase):
             self.assertEqual(self.binder.unwrap_model(), "connector.test.record")
             # unwrapping the binding should give the same binding
             self.assertEqual(self.binder.unwrap_binding(test_binding), test_record)
+
+    def test_stateless_binder(self):
+        """A binder is shared in a work context when it is stateless"""
+        with self.backend_record.work_on("connector.test.binding") as work:
+            binder = work.component(usage="binder")
+            self.assertIs(binder, work.component(usage="binder"))
+            # the binders have to declare it
+            self.assertFalse(work.components_registry["base.binder"]._stateless)